@@ -0,0 +1,57 @@
+import pygame
+
+class SpatialHash:
+    """Uniform grid of rects for entities that rarely move.
+
+    Each entity is stored with the rect it was inserted with, in every cell that
+    rect touches, so a query only looks at the handful of cells around it. An
+    entity that does move has to be re-filed with move().
+    """
+    def __init__(self, cell_size=256):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> [(rect, entity), ...]
+        self.entries = {}  # id(entity) -> (rect, entity)
+
+    def _keys(self, rect):
+        size = self.cell_size
+        for cell_x in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cell_y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield cell_x, cell_y
+
+    def insert(self, rect, entity):
+        entry = (pygame.Rect(rect), entity)
+        self.entries[id(entity)] = entry
+        for key in self._keys(entry[0]):
+            self.cells.setdefault(key, []).append(entry)
+
+    def remove(self, entity):
+        entry = self.entries.pop(id(entity), None)
+        if entry is None:
+            return
+        for key in self._keys(entry[0]):
+            cell = self.cells[key]
+            # Match by identity; entities such as dicts can compare equal
+            cell[:] = [e for e in cell if e is not entry]
+            if not cell:
+                del self.cells[key]
+
+    def move(self, rect, entity):
+        """Re-file an entity under its new rect"""
+        self.remove(entity)
+        self.insert(rect, entity)
+
+    def clear(self):
+        self.cells.clear()
+        self.entries.clear()
+
+    def query(self, rect):
+        """Get the entities whose stored rects overlap rect"""
+        cells = self.cells
+        seen = set()
+        found = []
+        for key in self._keys(rect):
+            for entry in cells.get(key, ()):
+                if id(entry) not in seen and rect.colliderect(entry[0]):
+                    seen.add(id(entry))
+                    found.append(entry[1])
+        return found
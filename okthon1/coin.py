@@ -1,9 +1,33 @@
 import pygame
 
 class Coin:
+    __slots__ = ('image', 'rect')
+
     def __init__(self, x, y, image):
         self.image = image
         self.rect = self.image.get_rect(topleft=(x, y))
 
     def draw(self, screen, camera_x, camera_y):
-        screen.blit(self.image, (self.rect.x - camera_x, self.rect.y - camera_y))
+        rect = self.rect
+        dx = rect.x - int(camera_x)
+        dy = rect.y - int(camera_y)
+        # Skip coins outside the view
+        if dx + rect.width < 0 or dx > screen.get_width() or dy + rect.height < 0 or dy > screen.get_height():
+            return
+        screen.blit(self.image, (dx, dy))
+
+    @classmethod
+    def visible_blits(cls, coins, camera_x, camera_y, view_w, view_h):
+        """Get (image, position) pairs for the coins inside the view"""
+        cam_x = int(camera_x)
+        cam_y = int(camera_y)
+        batch = []
+        append = batch.append
+        for coin in coins:
+            rect = coin.rect
+            dx = rect.x - cam_x
+            dy = rect.y - cam_y
+            if dx + rect.width < 0 or dx > view_w or dy + rect.height < 0 or dy > view_h:
+                continue
+            append((coin.image, (dx, dy)))
+        return batch
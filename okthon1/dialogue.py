@@ -1,5 +1,20 @@
 import pygame
 
+# (name_font, text_font), resolved once and shared by every DialogueBox
+_fonts = None
+
+def _load_fonts():
+    """Look up the dialogue fonts the first time they are needed"""
+    global _fonts
+    if _fonts is None:
+        try:
+            _fonts = (pygame.font.SysFont('Arial', 32, bold=True),
+                      pygame.font.SysFont('Comic Sans MS', 32))
+        except:
+            _fonts = (pygame.font.SysFont(None, 32, bold=True),
+                      pygame.font.SysFont(None, 32))
+    return _fonts
+
 class DialogueBox:
     def __init__(self, screen_width, screen_height, lines, display_time=2.5):
         self.lines = lines  # List of (name, text) tuples
@@ -9,9 +24,20 @@ class DialogueBox:
         self.active = True
         self.screen_width = screen_width
         self.screen_height = screen_height
+        # Use a clear, distinct font
+        self.name_font, self.text_font = _load_fonts()
+        # Semi-transparent dialogue background, built once in the display format
+        self.overlay = pygame.Surface((700, 120), pygame.SRCALPHA).convert_alpha()
+        self.overlay.fill((0, 0, 0, 200))
+        center_x = screen_width // 2
+        y = screen_height - 180
+        self._overlay_pos = (center_x - 350, y)
+        self._name_pos = (center_x - 320, y + 20)
+        self._text_layer = None  # name and line text for the current line, merged into one surface
+        self._text_index = None  # line index _text_layer was built for; any other index is dirty
 
     def update(self, dt):
-        if not self.active:
+        if not self.active or self.index >= len(self.lines):
             return
         self.timer += dt
         if self.timer > self.display_time:
@@ -30,24 +56,23 @@ class DialogueBox:
     def draw(self, screen):
         if not self.active or self.index >= len(self.lines):
             return
-        # Draw a semi-transparent rectangle as dialogue background
-        overlay = pygame.Surface((700, 120), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        center_x = self.screen_width // 2
-        y = self.screen_height - 180
-        screen.blit(overlay, (center_x - 350, y))
-        # Use a clear, distinct font
-        try:
-            name_font = pygame.font.SysFont('Arial', 32, bold=True)
-            text_font = pygame.font.SysFont('Comic Sans MS', 32)
-        except:
-            name_font = pygame.font.SysFont(None, 32, bold=True)
-            text_font = pygame.font.SysFont(None, 32)
-        name, line = self.lines[self.index]
-        name_text = name_font.render(name + ':', True, (255, 255, 0) if name == 'Player' else (255, 80, 80))
-        line_text = text_font.render(line, True, (255, 255, 255))
-        screen.blit(name_text, (center_x - 320, y + 20))
-        screen.blit(line_text, (center_x - 320 + name_text.get_width() + 20, y + 20))
+        screen.blit(self.overlay, self._overlay_pos)
+        # Text only changes when the line advances, so rebuild the text layer only then
+        if self._text_index != self.index:
+            self._text_layer = self._build_text_layer()
+            self._text_index = self.index
+        screen.blit(self._text_layer, self._name_pos)
 
-    def is_active(self):
-        return self.active 
\ No newline at end of file
+    def _build_text_layer(self):
+        """Render the current name and line side by side on one transparent surface"""
+        name, line = self.lines[self.index]
+        name_text = self.name_font.render(name + ':', True, (255, 255, 0) if name == 'Player' else (255, 80, 80))
+        line_text = self.text_font.render(line, True, (255, 255, 255))
+        line_x = name_text.get_width() + 20
+        size = (line_x + line_text.get_width(), max(name_text.get_height(), line_text.get_height()))
+        layer = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        layer.fill((0, 0, 0, 0))
+        # The two texts never overlap, so a max blend copies their pixels unchanged
+        layer.blit(name_text, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        layer.blit(line_text, (line_x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        return layer
@@ -1,7 +1,63 @@
 import pygame
-from projectile import Projectile
+from projectile import Projectile, ProjectileSystem
+
+class ProjectileGrid:
+    """Uniform spatial hash of projectiles, rebuilt once per frame"""
+    cell = 64
+
+    def __init__(self):
+        self.cells = {}  # (cx, cy) -> list of projectiles
+
+    def clear(self):
+        self.cells.clear()
+
+    def insert(self, proj):
+        """Add a projectile to every cell its rect overlaps"""
+        rect = proj.get_rect()
+        cell = self.cell
+        cells = self.cells
+        for cx in range(rect.left // cell, (rect.right - 1) // cell + 1):
+            for cy in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [proj]
+                else:
+                    bucket.append(proj)
+
+    def rebuild(self, projectiles):
+        """Clear the grid and insert the given projectiles"""
+        self.clear()
+        for proj in projectiles:
+            self.insert(proj)
+
+    def query(self, rect):
+        """Get the projectiles sharing a cell with rect (no duplicates)"""
+        cell = self.cell
+        cells = self.cells
+        found = []
+        seen = set()
+        for cx in range(rect.left // cell, (rect.right - 1) // cell + 1):
+            for cy in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+                for proj in cells.get((cx, cy), ()):
+                    if id(proj) not in seen:
+                        seen.add(id(proj))
+                        found.append(proj)
+        return found
+
+    def collides(self, rect):
+        """Check if any projectile in the grid hits rect"""
+        return rect.collidelist([p._rect for p in self.query(rect)]) != -1
 
 class Enemy:
+    # Fixed attribute layout: no per-instance __dict__ on the per-frame path
+    __slots__ = ('x', 'y', 'scale_factor', 'width', 'height', 'vel_x', 'direction',
+                 'shoot_cooldown', 'shoot_timer', 'projectiles', 'projectile_system',
+                 'last_shot_time', 'is_aiming', 'patrol_max_x', 'shoot_range',
+                 'sight_height', '_rect', '_glow_offset', '_glow', 'sprite')
+
+    # Scaled sprites shared by every enemy of the same size
+    _sprite_cache = {}
+
     def __init__(self, x, y, scale_factor=1.0):
         self.x = x
         self.y = y
@@ -13,32 +69,71 @@ class Enemy:
         self.shoot_cooldown = 0.8  # Much faster shooting
         self.shoot_timer = 0
         self.projectiles = []
+        self.projectile_system = None  # Set by EnemyManager to share one system
         self.last_shot_time = 0
         self.is_aiming = False
 
-        # Scale enemy sprite
-        original_sprite = pygame.image.load('data/images/entities/enemy/idle/00.png')
-        self.sprite = pygame.transform.scale(original_sprite, (self.width, self.height))
+        # AI distances only depend on scale, so compute them once
+        self.patrol_max_x = 900 * scale_factor
+        self.shoot_range = 1200 * scale_factor  # Much larger range
+        self.sight_height = 100 * scale_factor  # Tighter vertical range
 
-    def update(self, dt, player, camera_x, screen_width):
-        # Move enemy
-        self.x += self.vel_x * self.direction
-        if self.x < 0 or self.x > 900 * self.scale_factor:
-            self.direction *= -1
+        # Collision rect, moved in place as the enemy patrols
+        self._rect = pygame.Rect(self.x, self.y, self.width, self.height)
+
+        # Red glow drawn around the enemy while aiming; size is fixed after init
+        glow_radius = self.width // 2 + int(10 * scale_factor)
+        self._glow_offset = int(10 * scale_factor)
+        glow = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(glow, (255, 0, 0, 100), (glow_radius, glow_radius), glow_radius)
+        self._glow = glow.convert_alpha()
+
+        # Scale enemy sprite (loaded once per size)
+        key = (self.width, self.height)
+        sprite = Enemy._sprite_cache.get(key)
+        if sprite is None:
+            original_sprite = pygame.image.load('data/images/entities/enemy/idle/00.png').convert_alpha()
+            sprite = pygame.transform.scale(original_sprite, key)
+            Enemy._sprite_cache[key] = sprite
+        self.sprite = sprite
+
+    def _visible(self, camera_x, screen_width, margin=200):
+        """Check if the enemy is within the camera view (plus a margin)"""
+        return camera_x - margin <= self.x <= camera_x + screen_width + margin
 
+    def update(self, dt, player, camera_x, screen_width):
         # Check if player is visible horizontally (same Y level)
         player_on_screen = camera_x <= player.x <= camera_x + screen_width
-        in_range = abs(self.x - player.x) < 1200 * self.scale_factor  # Much larger range
+        self.tick(dt, player, player_on_screen, camera_x, screen_width)
+
+    def tick(self, dt, player, player_on_screen, camera_x, screen_width):
+        """Update the enemy given the frame-wide player_on_screen check"""
+        # Skip far off-screen enemies that have nothing in flight
+        if not self.projectiles and not self._visible(camera_x, screen_width):
+            self.is_aiming = False
+            return
+
+        # Move enemy
+        direction = self.direction
+        x = self.x + self.vel_x * direction
+        if x < 0 or x > self.patrol_max_x:
+            direction = -direction
+            self.direction = direction
+        self.x = x
+        self._rect.x = int(x)
+        self._rect.y = int(self.y)
+
+        px = player.x
+        in_range = abs(x - px) < self.shoot_range
         
         # Check if player is roughly at the same Y level (horizontal line of sight)
-        horizontal_sight = abs(self.y - player.y) < 100 * self.scale_factor  # Tighter vertical range
+        horizontal_sight = abs(self.y - player.y) < self.sight_height
         
         # Check if enemy is facing the player
-        enemy_facing_player = False
-        if self.direction == 1:  # Enemy facing right
-            enemy_facing_player = player.x > self.x
+        if direction == 1:  # Enemy facing right
+            enemy_facing_player = px > x
         else:  # Enemy facing left
-            enemy_facing_player = player.x < self.x
+            enemy_facing_player = px < x
 
         # Shoot only if player is on screen, in range, at same Y level, and enemy is facing player
         if player_on_screen and in_range and horizontal_sight and enemy_facing_player:
@@ -50,36 +145,88 @@ class Enemy:
         else:
             self.is_aiming = False
 
-        # Update projectiles
-        for proj in self.projectiles:
+        # Update projectiles and drop off-screen ones in place (order doesn't matter)
+        projs = self.projectiles
+        for i in range(len(projs) - 1, -1, -1):
+            proj = projs[i]
             proj.update(dt)
-        self.projectiles = [p for p in self.projectiles if not p.off_screen()]
+            if proj.off_screen():
+                projs[i] = projs[-1]
+                projs.pop()
 
     def shoot(self, player):
         # Shoot directly at player
+        if self.projectile_system is not None:
+            self.projectile_system.spawn(self.x + self.width // 2, self.y + self.height // 2, player.x, player.y)
+            return
         proj = Projectile(self.x + self.width // 2, self.y + self.height // 2, player.x, player.y)
         self.projectiles.append(proj)
 
     def draw(self, screen, camera_x, camera_y):
-        # Draw aiming indicator
-        if self.is_aiming:
-            # Draw red glow around enemy when aiming
-            glow_radius = self.width // 2 + int(10 * self.scale_factor)
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (255, 0, 0, 100), (glow_radius, glow_radius), glow_radius)
-            screen.blit(glow_surface, (self.x - camera_x - int(10 * self.scale_factor), self.y - camera_y - int(10 * self.scale_factor)))
-        
-        screen.blit(self.sprite, (self.x - camera_x, self.y - camera_y))
-        for proj in self.projectiles:
-            proj.draw(screen, camera_x, camera_y)
+        self.draw_body(screen, camera_x, camera_y)
+        # Draw all projectiles with one batched blit
+        projs = self.projectiles
+        if projs:
+            cam_x = int(camera_x)
+            cam_y = int(camera_y)
+            screen.blits([(p.image, (int(p.x) - cam_x, int(p.y) - cam_y)) for p in projs], doreturn=False)
 
-    def check_player_collision(self, player):
-        player_rect = pygame.Rect(player.x, player.y, player.width, player.height)
-        for proj in self.projectiles:
-            if player_rect.colliderect(proj.get_rect()):
-                return True
-        return False
+    def draw_body(self, screen, camera_x, camera_y):
+        """Draw the enemy and its aiming glow, without projectiles"""
+        # Only blit the enemy itself when it is near the camera view
+        if self._visible(camera_x, screen.get_width()):
+            blit = screen.blit
+            sx = int(self.x - camera_x)
+            sy = int(self.y - camera_y)
+            # Draw aiming indicator
+            if self.is_aiming:
+                offset = self._glow_offset
+                blit(self._glow, (sx - offset, sy - offset))
+
+            blit(self.sprite, (sx, sy))
+
+    def check_player_collision(self, player, grid=None):
+        """Check if a projectile hits the player.
+
+        When a ProjectileGrid is given, it is queried instead of scanning this
+        enemy's projectiles; the grid holds every enemy's shots, so call it once
+        per frame rather than once per enemy.
+        """
+        player_rect = player.rect
+        if grid is not None:
+            return grid.collides(player_rect)
+        return player_rect.collidelist([p._rect for p in self.projectiles]) != -1
 
     @property
     def rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height) 
\ No newline at end of file
+        return self._rect
+
+class EnemyManager:
+    """Updates, draws and collides all enemies in single per-frame passes"""
+    def __init__(self):
+        self.enemies = []
+        self.projectiles = ProjectileSystem()
+        self.grid = ProjectileGrid()
+
+    def add(self, enemy):
+        enemy.projectile_system = self.projectiles
+        self.enemies.append(enemy)
+
+    def update(self, dt, player, camera_x, screen_width):
+        """Update every enemy and projectile, then rebuild the projectile grid"""
+        # The player-side checks are the same for every enemy, so do them once
+        player_on_screen = camera_x <= player.x <= camera_x + screen_width
+        for enemy in self.enemies:
+            enemy.tick(dt, player, player_on_screen, camera_x, screen_width)
+        self.projectiles.update(dt)
+        self.grid.rebuild(self.projectiles.active)
+
+    def draw(self, screen, camera_x, camera_y):
+        # Bodies first, then every projectile in one batched blit
+        for enemy in self.enemies:
+            enemy.draw_body(screen, camera_x, camera_y)
+        self.projectiles.draw(screen, camera_x, camera_y)
+
+    def check_player_collision(self, player):
+        """Check if any enemy projectile hits the player"""
+        return self.grid.collides(player.rect)
\ No newline at end of file
@@ -1,5 +1,20 @@
 import pygame
 
+# Scaled (and optionally flipped) images keyed by (path, width, height, flipped)
+_image_cache = {}
+
+def load_scaled_image(path, width, height, flipped=False):
+    """Load an image once and share the scaled surface between instances"""
+    key = (path, width, height, flipped)
+    image = _image_cache.get(key)
+    if image is None:
+        image = pygame.image.load(path).convert_alpha()
+        image = pygame.transform.scale(image, (width, height))
+        if flipped:
+            image = pygame.transform.flip(image, True, False)
+        _image_cache[key] = image
+    return image
+
 class Entity:
     """Base class for all game entities."""
     def __init__(self, x, y, width, height):
@@ -29,6 +44,8 @@ class Enemy(Entity):
         # Add enemy logic here
         pass 
 class Knife:
+    __slots__ = ('x', 'y', 'speed', 'width', 'height', 'image', 'rect')
+
     def __init__(self, x, y, direction):
         self.x = x
         self.y = y
@@ -36,10 +53,7 @@ class Knife:
         self.width = 20
         self.height = 10
         # Load knife sprite
-        self.image = pygame.image.load('tiled/PNG/Items/knife.png')  # your knife image path
-        self.image = pygame.transform.scale(self.image, (self.width, self.height))
-        if direction == -1:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = load_scaled_image('tiled/PNG/Items/knife.png', self.width, self.height, direction == -1)  # your knife image path
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)    
 
     def update(self, dt):
@@ -47,19 +61,30 @@ class Knife:
         self.rect.x = self.x
 
     def draw(self, screen, camera_x, camera_y):
-        screen.blit(self.image, (self.x - camera_x, self.y - camera_y))
+        dx = int(self.x - camera_x)
+        dy = int(self.y - camera_y)
+        # Skip blits outside the view
+        if dx + self.width < 0 or dx > screen.get_width() or dy + self.height < 0 or dy > screen.get_height():
+            return
+        screen.blit(self.image, (dx, dy))
 
     def off_screen(self):
         return self.x < 0 or self.x > 2000  # Adjust 2000 to your map width or screen width
 class KnifePickup:
+    __slots__ = ('x', 'y', 'width', 'height', 'image', 'rect')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
         self.width = 16
         self.height = 16
-        self.image = pygame.image.load('tiled/PNG/Items/knife.png')  # Your knife pickup image
-        self.image = pygame.transform.scale(self.image, (self.width, self.height))
+        self.image = load_scaled_image('tiled/PNG/Items/knife.png', self.width, self.height)  # Your knife pickup image
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
 
     def draw(self, screen, camera_x, camera_y):
-        screen.blit(self.image, (self.x - camera_x, self.y - camera_y))
+        dx = int(self.x - camera_x)
+        dy = int(self.y - camera_y)
+        # Skip blits outside the view
+        if dx + self.width < 0 or dx > screen.get_width() or dy + self.height < 0 or dy > screen.get_height():
+            return
+        screen.blit(self.image, (dx, dy))
@@ -5,14 +5,26 @@ import xml.etree.ElementTree as ET
 import os
 import json
 import math
+from collections import deque
 from player import Player
 from dialogue import DialogueBox
 from coin import Coin
 from entities import Knife, KnifePickup
 from npc import NPC
 from medicine import Medicine
-from trash_item import TrashItem, Dustbin
+from trash_item import TrashItem, Dustbin, update_item_animations
 from item_system import Inventory
+from renderer import Renderer
+from broadphase import SpatialHash
+
+SKY_COLOR = (135, 206, 235)
+
+# (TMX object group name, item type, image path, log label) for each kind of map collectible
+COLLECTIBLE_GROUPS = [
+    ('water bottle', 'water', 'game images/water.jpeg', 'Water bottle'),
+    ('first aid', 'first_aid', 'game images/first aid.jpeg', 'First aid'),
+    ('soap', 'soap', 'game images/soap.jpeg', 'Soap'),
+]
 
 class Game:
     def __init__(self):
@@ -37,14 +49,27 @@ class Game:
         # UI settings
         self.font_size = int(24 * self.scale_factor)
         self.ui_padding = int(20 * self.scale_factor)
+        self._text_cache = {}  # (text, color) -> rendered UI text surface
+        self._health_bars = {}  # (fill width, color) -> pre-drawn health bar
+        self._pause_menu_cache = {}  # scale factor -> pause menu surfaces
         
         # Performance monitoring
-        self.frame_times = []
+        self.frame_times = deque(maxlen=60)  # Last 60 frame times
+        self._frame_time_sum = 0.0  # Running sum of frame_times
         self.last_frame_time = time.time()
+        
+        # Keys that went down this frame, filled from KEYDOWN events in run()
+        self._pressed_this_frame = set()
+        
+        # Frame counters for throttled checks and debug output
+        self._fps_counter = 0
+        self._medicine_check_counter = 0
+        self._camera_debug_counter = 0
+        self.debug_print = False  # Print camera/player positions every 120 frames
         self.fps = 60.0  # Initialize FPS
         
-        # Tile cache for performance
-        self.tile_cache = {}
+        # Display list for batched sprite blits
+        self.renderer = Renderer()
         
         # Load game assets
         self.load_game_assets()
@@ -92,6 +117,28 @@ class Game:
         self.map_data = self.load_tmx_map_with_tilesets('mapps/Legacy-Fantasy - High Forest 2.3/finalmap.tmx')
         self.collision_grid = self.create_collision_grid()
         
+        # UI dustbin icon, loaded and scaled once instead of every frame
+        try:
+            dustbin_image = pygame.image.load('game images/dustbin.jpeg').convert_alpha()
+            dustbin_width = int(dustbin_image.get_width() * 0.5)
+            dustbin_height = int(dustbin_image.get_height() * 0.5)
+            self._ui_dustbin = pygame.transform.scale(dustbin_image, (dustbin_width, dustbin_height))
+        except Exception as e:
+            print(f"Error loading dustbin image: {e}")
+            self._ui_dustbin = None
+        
+        # Collectible images, loaded and scaled once per path
+        self._collectible_images = {}
+        for group_name, item_type, image_path, label in COLLECTIBLE_GROUPS:
+            try:
+                image = pygame.image.load(image_path).convert_alpha()
+                self._collectible_images[image_path] = pygame.transform.scale(image, (32, 32))
+            except Exception:
+                # Fallback if image not found
+                image = pygame.Surface((32, 32))
+                image.fill((255, 255, 255))
+                self._collectible_images[image_path] = image
+        
         # Initialize game objects
         self.player = Player(self.screen_width, self.screen_height)
         self.npc = NPC(self.screen_width, self.screen_height)
@@ -180,6 +227,11 @@ class Game:
                 else:
                     print(f"Warning: Tileset image not found: {tileset_image}")
         
+        # Flatten the tilesets into a GID -> (tileset, tile_x, tile_y) table
+        self._gid_table = self.build_gid_table()
+        # Tile subsurfaces, indexed by GID like _gid_table and filled on first use
+        self.tile_cache = [None] * len(self._gid_table)
+        
         # Load layers
         layers = []
         for layer in root.findall('layer'):
@@ -193,7 +245,8 @@ class Game:
             data_elem = layer.find('data')
             if data_elem is not None:
                 csv_data = data_elem.text.strip()
-                layer_data['data'] = [int(x) for x in csv_data.split(',') if x.strip()]
+                # map() keeps the int() conversion loop in C; int() itself skips the newlines
+                layer_data['data'] = list(map(int, filter(str.strip, csv_data.split(','))))
             
             layers.append(layer_data)
         
@@ -215,6 +268,21 @@ class Game:
             
             object_groups[group_name] = objects
         
+        # The map is static, so pre-render each layer into one map-sized surface
+        self.layer_surfaces = []
+        for name, tiles in self.build_layer_blits(layers, map_width, map_height, tile_width, tile_height):
+            if not self.layer_surfaces:
+                # Both tilesets have transparent pixels, but the bottom layer is always drawn
+                # over the sky, so bake the sky in and keep it opaque for the plain copy blitter
+                layer_surface = pygame.Surface((map_width * tile_width, map_height * tile_height)).convert()
+                layer_surface.fill(SKY_COLOR)
+            else:
+                layer_surface = pygame.Surface((map_width * tile_width, map_height * tile_height), pygame.SRCALPHA).convert_alpha()
+            layer_surface.blits([(surface, (x, y)) for surface, x, y in tiles], doreturn=False)
+            self.layer_surfaces.append((name, layer_surface))
+        # Baked ground layer on its own, for render_ground_only
+        self._ground_surface = next((s for name, s in self.layer_surfaces if name == 'ground'), None)
+        
         return {
             'width': map_width,
             'height': map_height,
@@ -224,10 +292,69 @@ class Game:
             'object_groups': object_groups
         }
 
+    def build_layer_blits(self, layers, map_width, map_height, tile_width, tile_height):
+        """Build a (surface, x, y) list per layer, sorted in render order"""
+        gid_table = self._gid_table
+        table_size = len(gid_table)
+        tile_cache = self.tile_cache
+        # Column pixel offsets are the same for every row of every layer
+        column_x = [x * tile_width for x in range(map_width)]
+        layer_blits = []
+        for layer in sorted(layers, key=lambda x: x['name']):
+            data = layer['data']
+            layer_width = layer['width']
+            blits = []
+            append = blits.append
+            for y in range(map_height):
+                # Walk one row slice at a time; the slice already stops at the end of the data
+                start = y * layer_width
+                pixel_y = y * tile_height
+                for pixel_x, gid in zip(column_x, data[start:start + map_width]):
+                    # GID 0 is empty; GIDs outside every tileset have no image
+                    if gid == 0 or gid >= table_size:
+                        continue
+                    surface = tile_cache[gid]
+                    if surface is None:
+                        entry = gid_table[gid]
+                        if entry is None:
+                            continue
+                        tileset, tile_x, tile_y = entry
+                        try:
+                            surface = tileset['image'].subsurface((tile_x, tile_y, tile_width, tile_height))
+                        except ValueError:
+                            continue
+                        tile_cache[gid] = surface
+                    append((surface, pixel_x, pixel_y))
+            layer_blits.append((layer['name'], blits))
+        return layer_blits
+
+    def build_gid_table(self):
+        """Build a list indexed by GID holding (tileset, tile_x, tile_y), or None for unused GIDs"""
+        max_gid = 0
+        for firstgid, tileset in self.tilesets.items():
+            rows = tileset['image'].get_height() // tileset['tileheight']
+            max_gid = max(max_gid, firstgid + tileset['columns'] * rows)
+        
+        gid_table = [None] * (max_gid + 1)
+        # Later tilesets win on overlap, matching the highest-firstgid rule in get_tileset_for_gid
+        for firstgid in sorted(self.tilesets):
+            tileset = self.tilesets[firstgid]
+            columns = tileset['columns']
+            rows = tileset['image'].get_height() // tileset['tileheight']
+            for local_tid in range(columns * rows):
+                gid_table[firstgid + local_tid] = (tileset,
+                                                   (local_tid % columns) * tileset['tilewidth'],
+                                                   (local_tid // columns) * tileset['tileheight'])
+        return gid_table
+
     def get_tileset_for_gid(self, gid):
         """Get the appropriate tileset for a given GID"""
         if gid == 0:
             return None
+        if gid < len(self._gid_table):
+            entry = self._gid_table[gid]
+            if entry is not None:
+                return entry[0]
             
         # Find the tileset with the highest firstgid that's <= gid
         best_tileset = None
@@ -258,39 +385,39 @@ class Game:
 
     def create_collision_grid(self):
         """Create collision grid from ground layer"""
-        grid = [[0 for _ in range(self.map_data['width'])] for _ in range(self.map_data['height'])]
+        map_width = self.map_data['width']
+        grid = [[0] * map_width for _ in range(self.map_data['height'])]
         
         # Get ground layer
         ground_layer = next((l for l in self.map_data['layers'] if l['name'] == 'ground'), None)
         
         if ground_layer:
-            solid_tiles = 0
-            print(f"Ground layer found: {ground_layer['name']}")
-            print(f"Ground layer dimensions: {ground_layer['width']}x{ground_layer['height']}")
-            print(f"Ground layer data length: {len(ground_layer['data'])}")
-            
-            for y in range(self.map_data['height']):
-                for x in range(self.map_data['width']):
-                    index = y * ground_layer['width'] + x
-                    if index < len(ground_layer['data']):
-                        gid = ground_layer['data'][index]
-                        if gid != 0:
-                            grid[y][x] = 1  # Solid tile
-                            solid_tiles += 1
-            
-            print(f"Created collision grid with {solid_tiles} solid tiles")
-            print(f"Grid dimensions: {len(grid)}x{len(grid[0])}")
+            data = ground_layer['data']
+            layer_width = ground_layer['width']
             
-            # Print some sample ground tiles around the expected ground level
-            ground_y = 25  # Expected ground level (around y=800 in pixels)
-            print(f"Sample ground tiles at Y={ground_y}:")
-            for x in range(0, min(10, len(grid[0]))):  # First 10 tiles
-                print(f"  Tile at ({x}, {ground_y}): {grid[ground_y][x]}")
+            # Any non-zero gid is a solid tile; fill each row from a slice of the flat layer data
+            for y, row in enumerate(grid):
+                start = y * layer_width
+                cells = [1 if gid else 0 for gid in data[start:start + map_width]]
+                row[:len(cells)] = cells
             
-            # Also check the bottom rows where ground should be
-            print(f"Sample ground tiles at Y=29 (bottom):")
-            for x in range(0, min(10, len(grid[0]))):  # First 10 tiles
-                print(f"  Tile at ({x}, 29): {grid[29][x]}")
+            if __debug__:
+                print(f"Ground layer found: {ground_layer['name']}")
+                print(f"Ground layer dimensions: {ground_layer['width']}x{ground_layer['height']}")
+                print(f"Ground layer data length: {len(data)}")
+                print(f"Created collision grid with {sum(map(sum, grid))} solid tiles")
+                print(f"Grid dimensions: {len(grid)}x{len(grid[0])}")
+                
+                # Print some sample ground tiles around the expected ground level
+                ground_y = 25  # Expected ground level (around y=800 in pixels)
+                print(f"Sample ground tiles at Y={ground_y}:")
+                for x in range(0, min(10, len(grid[0]))):  # First 10 tiles
+                    print(f"  Tile at ({x}, {ground_y}): {grid[ground_y][x]}")
+                
+                # Also check the bottom rows where ground should be
+                print(f"Sample ground tiles at Y=29 (bottom):")
+                for x in range(0, min(10, len(grid[0]))):  # First 10 tiles
+                    print(f"  Tile at ({x}, 29): {grid[29][x]}")
         else:
             print("No ground layer found for collision grid")
             print("Available layers:")
@@ -314,79 +441,44 @@ class Game:
 
     def render_map(self):
         """Render the TMX map with all layers"""
-        # Get all layers and sort them by name for proper rendering order
-        all_layers = self.map_data['layers']
-        
-        # Sort layers: background first, then ground
-        layers_sorted = sorted(all_layers, key=lambda x: x['name'])
-        
-        # Calculate tile dimensions
-        tile_width = self.map_data['tilewidth']
-        tile_height = self.map_data['tileheight']
-        
-        # Render all layers
-        for layer in layers_sorted:
-            tiles_rendered = 0
-            for y in range(self.map_data['height']):
-                for x in range(self.map_data['width']):
-                    index = y * layer['width'] + x
-                    if index < len(layer['data']):
-                        gid = layer['data'][index]
-                        if gid != 0:
-                            tileset = self.get_tileset_for_gid(gid)
-                            if tileset:
-                                # Calculate tile position
-                                local_tid = gid - tileset.get('firstgid', 0)
-                                if local_tid >= 0:  # Ensure valid local tile ID
-                                    tile_x = (local_tid % tileset['columns']) * tileset['tilewidth']
-                                    tile_y = (local_tid // tileset['columns']) * tileset['tileheight']
-                                    
-                                    screen_x = x * tile_width - self.camera_x
-                                    screen_y = y * tile_height - self.camera_y
-
-                                    # Only render tiles that are visible on screen
-                                    if -tile_width <= screen_x < self.screen.get_width() and -tile_height <= screen_y < self.screen.get_height():
-                                        # Use tile cache for performance
-                                        cache_key = f"{tileset['name']}_{local_tid}"
-                                        
-                                        if cache_key not in self.tile_cache:
-                                            try:
-                                                tile_surface = pygame.Surface((tile_width, tile_height), pygame.SRCALPHA)
-                                                tile_surface.blit(tileset['image'], (0, 0),
-                                                                  (tile_x, tile_y, tile_width, tile_height))
-                                                self.tile_cache[cache_key] = tile_surface
-                                            except Exception as e:
-                                                continue
-                                        else:
-                                            tile_surface = self.tile_cache[cache_key]
-                                        
-                                        self.screen.blit(tile_surface, (screen_x, screen_y))
-                                        tiles_rendered += 1
+        # Layers are pre-sorted (background first, then ground); the blit clips them to the screen.
+        # Floor the offset so the map lines up with sprites drawn at int(x - camera_x)
+        offset = (math.floor(-self.camera_x), math.floor(-self.camera_y))
+        self.screen.blits([(layer_surface, offset) for name, layer_surface in self.layer_surfaces], doreturn=False)
 
     def update_performance_monitoring(self):
         """Update performance monitoring"""
         current_time = time.time()
         frame_time = current_time - self.last_frame_time
-        self.frame_times.append(frame_time)
         
-        # Keep only last 60 frames
-        if len(self.frame_times) > 60:
-            self.frame_times.pop(0)
+        # Keep only last 60 frames; the deque drops the oldest one for us
+        if len(self.frame_times) == self.frame_times.maxlen:
+            self._frame_time_sum -= self.frame_times[0]
+        self.frame_times.append(frame_time)
+        self._frame_time_sum += frame_time
         
         self.last_frame_time = current_time
         
         # Calculate average FPS
         if len(self.frame_times) > 0:
-            avg_frame_time = sum(self.frame_times) / len(self.frame_times)
+            avg_frame_time = self._frame_time_sum / len(self.frame_times)
             fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
             # Print FPS every 120 frames (once per 4 seconds at 30 FPS)
-            if hasattr(self, '_fps_counter'):
-                self._fps_counter += 1
-            else:
-                self._fps_counter = 0
-                
             if self._fps_counter % 120 == 0:
                 print(f"FPS: {fps:.1f}")
+            self._fps_counter += 1
+
+    def _text(self, text, color=(255, 255, 255)):
+        """Render UI text, reusing the surface while the string stays the same"""
+        key = (text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # FPS and health strings keep changing, so keep the cache from growing forever
+            if len(self._text_cache) > 256:
+                self._text_cache.clear()
+            surface = self._ui_font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
 
     def draw_ui(self):
         """Draw UI elements"""
@@ -402,46 +494,49 @@ class Game:
         health_width = 200
         health_height = 20
         
-        # Health bar background
-        pygame.draw.rect(self.screen, (100, 100, 100), (10, 10, health_width, health_height))
-        # Health bar fill
         health_fill_width = int(health_width * health_percentage)
         health_color = (255, 0, 0) if health_percentage < 0.3 else (255, 255, 0) if health_percentage < 0.7 else (0, 255, 0)
-        pygame.draw.rect(self.screen, health_color, (10, 10, health_fill_width, health_height))
-        # Health bar border
-        pygame.draw.rect(self.screen, (255, 255, 255), (10, 10, health_width, health_height), 2)
+        
+        # The bar only depends on fill width and colour, so draw each variant once
+        key = (health_fill_width, health_color)
+        health_bar = self._health_bars.get(key)
+        if health_bar is None:
+            # Fill can overrun the bar when max health drops below current health
+            health_bar = pygame.Surface((max(health_width, health_fill_width), health_height), pygame.SRCALPHA).convert_alpha()
+            # Health bar background
+            pygame.draw.rect(health_bar, (100, 100, 100), (0, 0, health_width, health_height))
+            # Health bar fill
+            pygame.draw.rect(health_bar, health_color, (0, 0, health_fill_width, health_height))
+            # Health bar border
+            pygame.draw.rect(health_bar, (255, 255, 255), (0, 0, health_width, health_height), 2)
+            self._health_bars[key] = health_bar
+        self.screen.blit(health_bar, (10, 10))
         
         # Health text
         health_text = f"Health: {self.player.health}/{self.player.max_health}"
-        health_surface = self._ui_font.render(health_text, True, (255, 255, 255))
+        health_surface = self._text(health_text)
         self.screen.blit(health_surface, (10, 35))
         
         # Lives text
         lives_text = f"Lives: {self.player.lives}"
-        lives_surface = self._ui_font.render(lives_text, True, (255, 255, 255))
+        lives_surface = self._text(lives_text)
         self.screen.blit(lives_surface, (10, 60))
         
         # Cleanliness status
         cleanliness_text = f"Clean: {'Yes' if not self.player.is_dirty else 'No'}"
-        cleanliness_surface = self._ui_font.render(cleanliness_text, True, (255, 255, 255))
+        cleanliness_surface = self._text(cleanliness_text)
         self.screen.blit(cleanliness_surface, (10, 85))
         
         # FPS counter (top right)
         fps_text = f"FPS: {self.fps:.1f}"
-        fps_surface = self._ui_font.render(fps_text, True, (255, 255, 255))
+        fps_surface = self._text(fps_text)
         self.screen.blit(fps_surface, (self.screen.get_width() - 100, 20))
         
         # Draw dustbin image at right corner, 60% from top
-        try:
-            dustbin_image = pygame.image.load('game images/dustbin.jpeg').convert_alpha()
-            dustbin_width = int(dustbin_image.get_width() * 0.5)
-            dustbin_height = int(dustbin_image.get_height() * 0.5)
-            dustbin_image = pygame.transform.scale(dustbin_image, (dustbin_width, dustbin_height))
-            dustbin_x = self.screen.get_width() - dustbin_width - 10
+        if self._ui_dustbin is not None:
+            dustbin_x = self.screen.get_width() - self._ui_dustbin.get_width() - 10
             dustbin_y = int(self.screen.get_height() * 0.6)
-            self.screen.blit(dustbin_image, (dustbin_x, dustbin_y))
-        except Exception as e:
-            print(f"Error loading dustbin image: {e}")
+            self.screen.blit(self._ui_dustbin, (dustbin_x, dustbin_y))
         
         # UI elements for bottom of screen
         ui_elements = []
@@ -473,7 +568,7 @@ class Game:
         ]
         
         for i, text in enumerate(controls_text):
-            controls_surface = self._ui_font.render(text, True, (255, 255, 255))
+            controls_surface = self._text(text)
             self.screen.blit(controls_surface, (10, self.screen.get_height() - 60 + i * 25))
 
     def reset_game(self):
@@ -530,13 +625,15 @@ class Game:
         
         # Initialize coins
         self.coins = []
+        # Create a simple coin image (placeholder), shared by every coin
+        if not hasattr(self, '_coin_placeholder'):
+            coin_image = pygame.Surface((16, 16))
+            coin_image.fill((255, 215, 0))  # Gold color
+            self._coin_placeholder = coin_image.convert()
         for coin_data in self.map_data['object_groups'].get('coin', []):
             coin_x = coin_data['x'] * self.scale_x
             coin_y = coin_data['y'] * self.scale_y
-            # Create a simple coin image (placeholder)
-            coin_image = pygame.Surface((16, 16))
-            coin_image.fill((255, 215, 0))  # Gold color
-            self.coins.append(Coin(coin_x, coin_y, coin_image))
+            self.coins.append(Coin(coin_x, coin_y, self._coin_placeholder))
         
         # Initialize medicine items
         self.medicine_items = []
@@ -575,61 +672,29 @@ class Game:
         
         # Create collectible items on the map
         self.collectible_items = []
-        
-        # Add water bottles to map
-        if 'water bottle' in self.map_data['object_groups']:
-            for water_data in self.map_data['object_groups']['water bottle']:
-                x = water_data['x'] * self.scale_x
-                y = (water_data['y'] - 20) * self.scale_y
-                self.collectible_items.append({
-                    'type': 'water',
-                    'x': x,
-                    'y': y,
-                    'image_path': 'game images/water.jpeg',
-                    'collected': False
-                })
-                print(f"Water bottle at: {x:.1f}, {y:.1f}")
-        
-        # Add first aid to map
-        if 'first aid' in self.map_data['object_groups']:
-            for aid_data in self.map_data['object_groups']['first aid']:
-                x = aid_data['x'] * self.scale_x
-                y = (aid_data['y'] - 20) * self.scale_y
-                self.collectible_items.append({
-                    'type': 'first_aid',
-                    'x': x,
-                    'y': y,
-                    'image_path': 'game images/first aid.jpeg',
-                    'collected': False
-                })
-                print(f"First aid at: {x:.1f}, {y:.1f}")
-        
-        # Add soap to map
-        if 'soap' in self.map_data['object_groups']:
-            for soap_data in self.map_data['object_groups']['soap']:
-                x = soap_data['x'] * self.scale_x
-                y = (soap_data['y'] - 20) * self.scale_y
+        object_groups = self.map_data['object_groups']
+        scale_x = self.scale_x
+        scale_y = self.scale_y
+        for group_name, item_type, image_path, label in COLLECTIBLE_GROUPS:
+            for obj_data in object_groups.get(group_name, []):
+                x = obj_data['x'] * scale_x
+                y = (obj_data['y'] - 20) * scale_y
                 self.collectible_items.append({
-                    'type': 'soap',
+                    'type': item_type,
                     'x': x,
                     'y': y,
-                    'image_path': 'game images/soap.jpeg',
+                    'image_path': image_path,
                     'collected': False
                 })
-                print(f"Soap at: {x:.1f}, {y:.1f}")
+                print(f"{label} at: {x:.1f}, {y:.1f}")
         
         # Add items to inventory based on TMX object groups with correct images
-        if 'water bottle' in self.map_data['object_groups']:
-            for water_data in self.map_data['object_groups']['water bottle']:
-                self.inventory.add_item("water", 1)
-        
-        if 'first aid' in self.map_data['object_groups']:
-            for aid_data in self.map_data['object_groups']['first aid']:
-                self.inventory.add_item("first_aid", 1)
+        for group_name, item_type, image_path, label in COLLECTIBLE_GROUPS:
+            for obj_data in object_groups.get(group_name, []):
+                self.inventory.add_item(item_type, 1)
         
-        if 'soap' in self.map_data['object_groups']:
-            for soap_data in self.map_data['object_groups']['soap']:
-                self.inventory.add_item("soap", 1)
+        # Bucket the pickups that never move so collision checks only look near the player
+        self._build_spatial_index()
         
         # Quest system
         self.quest_active = False
@@ -641,6 +706,31 @@ class Game:
         self.camera_y = 0
         self.update_camera()
 
+    def _build_spatial_index(self):
+        """Index the stationary medicine, collectible and dustbin objects by grid cell"""
+        # Items still in the world; collected ones drop out of these and of the indexes
+        # below, so per-frame queries and drawing never revisit them
+        self._live_medicine = list(self.medicine_items)
+        self._live_collectibles = list(self.collectible_items)
+        self._live_trash = list(self.trash_items)
+        
+        self._medicine_index = SpatialHash()
+        for medicine in self.medicine_items:
+            self._medicine_index.insert(medicine.rect, medicine)
+        
+        self._item_index = SpatialHash()
+        for item in self.collectible_items:
+            self._item_index.insert(pygame.Rect(item['x'], item['y'], 32, 32), item)
+        
+        self._dustbin_index = SpatialHash()
+        for dustbin in self.dustbins:
+            self._dustbin_index.insert(dustbin.rect, dustbin)
+        
+        # Trash only moves when dropped or thrown, and handle_trash_input re-files it then
+        self._trash_index = SpatialHash()
+        for trash in self.trash_items:
+            self._trash_index.insert(trash.rect, trash)
+
     def run(self):
         """Main game loop"""
         running = True
@@ -648,10 +738,12 @@ class Game:
         
         while running:
             # Handle events
+            self._pressed_this_frame.clear()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
+                    self._pressed_this_frame.add(event.key)
                     self.handle_keydown(event)
                 elif event.type == pygame.VIDEORESIZE:
                     self.handle_resize(event.w, event.h)
@@ -730,7 +822,7 @@ class Game:
         self.update_camera()
         
         # Update dialogue timer
-        if self.dialogue_box.is_active():
+        if self.dialogue_box.active:
             self.dialogue_box.update(dt)
             if self.dialogue_timer > 0:
                 self.dialogue_timer -= dt
@@ -741,7 +833,7 @@ class Game:
         self.check_medicine_collection()
         
         # Check trash collection with health effects
-        self.check_trash_collection_with_health()
+        self.check_trash_collection_with_health(dt)
         
         # Update performance monitoring
         self.update_performance_monitoring()
@@ -749,85 +841,96 @@ class Game:
         # Update stationary NPC (quest giver)
         self.npc.update_quest_progress(self.player)
         
-        # Update inventory
-        keys = pygame.key.get_pressed()
-        self.inventory.handle_input(keys, self.player)
-        
-        # Update trash items
-        for trash in self.trash_items:
-            trash.update(dt)
+        # Update inventory; item use and trash actions fire once per key press, not every held frame
+        pressed = self._pressed_this_frame
+        self.inventory.handle_input(pressed, self.player)
         
-        # Update dustbins
+        # Advance the shared item animations; trash needs nothing per item since its bob
+        # is shared and _refile_trash keeps moved rects in step
+        update_item_animations(pygame.time.get_ticks())
         for dustbin in self.dustbins:
             dustbin.update(dt)
         
         # Handle trash input
-        self.handle_trash_input(keys)
+        self.handle_trash_input(pressed)
 
     def check_medicine_collection(self):
         """Check if player has collected medicine items"""
-        # Only check medicine collection every few frames to reduce lag
-        if hasattr(self, '_medicine_check_counter'):
-            self._medicine_check_counter += 1
-        else:
-            self._medicine_check_counter = 0
-            
-        # Check every 10 frames (at 30 FPS = 3 times per second)
-        if self._medicine_check_counter % 10 == 0:
-            for medicine in self.medicine_items:
+        # Only check medicine collection every few frames to reduce lag:
+        # every 10 frames (at 30 FPS = 3 times per second)
+        check = self._medicine_check_counter % 10 == 0
+        self._medicine_check_counter += 1
+        if check:
+            for medicine in self._medicine_index.query(self.player.rect):
                 if medicine.check_collision(self.player):
+                    self._medicine_index.remove(medicine)
+                    self._live_medicine.remove(medicine)
                     self.medicine_collected += 1
                     self.quest_active = True
                     self.npc.collected_items = self.medicine_collected
                     print(f"Medicine collected! {self.medicine_collected}/{self.medicine_required}")
     
-    def check_trash_collection_with_health(self):
+    def check_trash_collection_with_health(self, dt):
         """Check for trash collection and health effects"""
-        # Check for collectible items
-        for item in self.collectible_items:
+        player_rect = self.player.rect
+        
+        # Check for collectible items near the player
+        for item in self._item_index.query(player_rect):
             if not item['collected']:
-                item_rect = pygame.Rect(item['x'], item['y'], 32, 32)
-                if item_rect.colliderect(self.player.rect):
-                    item['collected'] = True
-                    if item['type'] == 'water':
-                        self.inventory.add_item("water", 1)
-                        print(f"Collected water bottle!")
-                    elif item['type'] == 'first_aid':
-                        self.inventory.add_item("first_aid", 1)
-                        print(f"Collected first aid!")
-                    elif item['type'] == 'soap':
-                        self.inventory.add_item("soap", 1)
-                        print(f"Collected soap!")
-        
-        # Check for trash items and health effects
-        for trash in self.trash_items:
+                item['collected'] = True
+                # Collected items never come back, so stop returning them from queries
+                self._item_index.remove(item)
+                # Match by identity; list.remove would take the first equal dict, and the map has duplicates
+                self._live_collectibles = [c for c in self._live_collectibles if c is not item]
+                if item['type'] == 'water':
+                    self.inventory.add_item("water", 1)
+                    print(f"Collected water bottle!")
+                elif item['type'] == 'first_aid':
+                    self.inventory.add_item("first_aid", 1)
+                    print(f"Collected first aid!")
+                elif item['type'] == 'soap':
+                    self.inventory.add_item("soap", 1)
+                    print(f"Collected soap!")
+        
+        # Check for trash items and health effects, only looking at trash around the player
+        player_x = self.player.x
+        player_y = self.player.y
+        nearby_trash = self._trash_index.query(player_rect.union(pygame.Rect(player_x - 20, player_y - 20, 41, 41)))
+        near_trash = False
+        for trash in nearby_trash:
             if not trash.collected:
-                # Check if player is near trash (within 20 pixels)
-                distance = ((self.player.x - trash.x) ** 2 + (self.player.y - trash.y) ** 2) ** 0.5
-                if distance <= 20:
-                    # Player is near trash - decrease health
-                    if self.player.is_dirty:
-                        self.player.health_drain_timer += 1/60  # Assuming 60 FPS
-                        if self.player.health_drain_timer >= 20.0:  # Every 20 seconds
-                            self.player.health = max(0, self.player.health - 10)
-                            self.player.health_drain_timer = 0
-                            print("Health decreased due to being near trash!")
+                # Check if player is near trash (within 20 pixels): cheap box reject first,
+                # then compare squared distances to skip the sqrt
+                dx = player_x - trash.x
+                dy = player_y - trash.y
+                if -20 <= dx <= 20 and -20 <= dy <= 20 and dx * dx + dy * dy <= 400:
+                    near_trash = True
                 
                 # Check for trash collection
-                if self.held_trash is None and trash.rect.colliderect(self.player.rect):
+                if self.held_trash is None and trash.rect.colliderect(player_rect):
                     self.held_trash = trash
                     trash.collected = True
+                    # Held trash is out of play until _refile_trash puts it back
+                    self._trash_index.remove(trash)
+                    self._live_trash.remove(trash)
                     print("Picked up trash!")
         
+        # Player is near trash - decrease health; the timer runs once per frame however many are close
+        if near_trash and self.player.is_dirty:
+            self.player.health_drain_timer += dt
+            if self.player.health_drain_timer >= 20.0:  # Every 20 seconds
+                self.player.health = max(0, self.player.health - 10)
+                self.player.health_drain_timer = 0
+                print("Health decreased due to being near trash!")
+        
         # Check for dustbin interaction
-        for dustbin in self.dustbins:
-            if self.held_trash is not None and dustbin.rect.colliderect(self.player.rect):
-                self.held_trash = None
-                print("Threw trash in dustbin!")
+        if self.held_trash is not None and self._dustbin_index.query(player_rect):
+            self.held_trash = None
+            print("Threw trash in dustbin!")
         
         # Check for stepping on dropped trash (health penalty)
-        for trash in self.trash_items:
-            if not trash.collected and trash.check_collision(self.player.rect):
+        for trash in nearby_trash:
+            if not trash.collected and trash.check_collision(player_rect):
                 if self.player.is_dirty:
                     self.player.max_health = max(0, self.player.max_health - 3)
                     print("You stepped on trash while dirty! Health -3")
@@ -835,19 +938,20 @@ class Game:
                     self.player.make_dirty()
                     print("You got dirty from stepping on trash!")
 
-    def handle_trash_input(self, keys):
-        """Handle trash-related input"""
+    def handle_trash_input(self, pressed):
+        """Handle trash-related input for the keys pressed this frame"""
         # Drop held trash with D key
-        if keys[pygame.K_d] and self.held_trash is not None:
+        if pygame.K_d in pressed and self.held_trash is not None:
             # Drop trash near player
             self.held_trash.x = self.player.x + 50
             self.held_trash.y = self.player.y
             self.held_trash.collected = False
+            self._refile_trash(self.held_trash)
             self.held_trash = None
             print("Trash dropped!")
         
         # Throw held trash with T key
-        if keys[pygame.K_t] and self.held_trash is not None:
+        if pygame.K_t in pressed and self.held_trash is not None:
             # Throw trash in the direction player is facing
             throw_distance = 100
             if self.player.facing_right:
@@ -856,9 +960,17 @@ class Game:
                 self.held_trash.x = self.player.x - throw_distance
             self.held_trash.y = self.player.y
             self.held_trash.collected = False
+            self._refile_trash(self.held_trash)
             self.held_trash = None
             print("Trash thrown!")
 
+    def _refile_trash(self, trash):
+        """Put dropped or thrown trash back in play, syncing its rect and its spot in the trash index"""
+        trash.rect.x = trash.x
+        trash.rect.y = trash.y
+        self._trash_index.move(trash.rect, trash)
+        self._live_trash.append(trash)
+
     def handle_resize(self, new_width, new_height):
         """Handle window resize"""
         self.game_width = new_width
@@ -873,11 +985,12 @@ class Game:
         # Update UI elements
         self.font_size = int(30 * self.scale_factor)
         self.ui_padding = int(20 * self.scale_factor)
+        self._pause_menu_cache.clear()
 
     def render(self):
         """Main rendering function"""
         # Clear screen
-        self.screen.fill((135, 206, 235))  # Sky blue background
+        self.screen.fill(SKY_COLOR)  # Sky blue background
         
         # Render all map layers properly
         self.render_map()
@@ -891,44 +1004,42 @@ class Game:
         # Render stationary NPC (quest giver)
         self.npc.draw(self.screen, self.camera_x, self.camera_y)
         
-        # Render coins
-        for coin in self.coins:
-            coin.draw(self.screen, self.camera_x, self.camera_y)
+        # Queue every world sprite on the display list, then blit them all in one batch
+        renderer = self.renderer
+        camera_x = self.camera_x
+        camera_y = self.camera_y
+        # Everything below is culled against the view so offscreen sprites never reach the batch
+        view_w = self.screen.get_width()
+        view_h = self.screen.get_height()
         
-        # Render medicine items
-        for medicine in self.medicine_items:
-            medicine.draw(self.screen, self.camera_x, self.camera_y)
+        # Coins
+        renderer.extend(Coin.visible_blits(self.coins, camera_x, camera_y, view_w, view_h))
         
-        # Draw trash items
-        for trash in self.trash_items:
-            trash.draw(self.screen, self.camera_x, self.camera_y)
+        # Medicine and trash items
+        renderer.extend(Medicine.blit_list(self._live_medicine, camera_x, camera_y, view_w, view_h))
+        renderer.extend(TrashItem.blit_list(self._live_trash, camera_x, camera_y, view_w, view_h))
         
-        # Draw dustbins
+        # Dustbins
         for dustbin in self.dustbins:
-            dustbin.draw(self.screen, self.camera_x, self.camera_y)
+            if dustbin.in_view(camera_x, camera_y, view_w, view_h):
+                dustbin.queue_draw(renderer, camera_x, camera_y)
         
-        # Draw collectible items
-        for item in self.collectible_items:
-            if not item['collected']:
-                try:
-                    # Load and scale the image
-                    image = pygame.image.load(item['image_path']).convert_alpha()
-                    image = pygame.transform.scale(image, (32, 32))
-                    self.screen.blit(image, (item['x'] - self.camera_x, item['y'] - self.camera_y))
-                except:
-                    # Fallback if image not found
-                    pygame.draw.rect(self.screen, (255, 255, 255), 
-                                   (item['x'] - self.camera_x, item['y'] - self.camera_y, 32, 32))
-        
-        # Draw held trash (if any)
+        # Collectible items, all 32x32
+        images = self._collectible_images
+        renderer.extend([(images[item['image_path']], (item['x'] - camera_x, item['y'] - camera_y))
+                         for item in self._live_collectibles
+                         if not item['collected'] and -32 <= item['x'] - camera_x <= view_w and -32 <= item['y'] - camera_y <= view_h])
+        
+        # Held trash (if any), drawn above player
         if self.held_trash is not None:
-            # Draw held trash above player
             held_x = self.player.x + 20
             held_y = self.player.y - 40
-            self.screen.blit(self.held_trash.image, (held_x - self.camera_x, held_y - self.camera_y))
+            renderer.add(self.held_trash.image, (held_x - camera_x, held_y - camera_y))
+        
+        renderer.flush(self.screen)
         
         # Render dialogue box
-        if self.dialogue_box.is_active():
+        if self.dialogue_box.active:
             self.dialogue_box.draw(self.screen)
         
         # Render inventory
@@ -940,63 +1051,18 @@ class Game:
         self.draw_ui()
 
         # Get ground layer only
-        ground_layer = next((l for l in self.map_data['layers'] if l['name'] == 'ground'), None)
-        if not ground_layer:
+        if self._ground_surface is None:
             return
 
-        # Calculate visible tile range for culling
-        tile_width = self.map_data['tilewidth']
-        tile_height = self.map_data['tileheight']
-        
-        # Very aggressive culling - only render exactly what's visible
-        start_x = max(0, int(self.camera_x // tile_width))
-        end_x = min(self.map_data['width'], int((self.camera_x + self.screen.get_width()) // tile_width) + 1)
-        start_y = max(0, int(self.camera_y // tile_height))
-        end_y = min(self.map_data['height'], int((self.camera_y + self.screen.get_height()) // tile_height) + 1)
+        self.screen.blit(self._ground_surface, (math.floor(-self.camera_x), math.floor(-self.camera_y)))
 
-        # Render only ground tiles
-        for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                index = y * ground_layer['width'] + x
-                if index < len(ground_layer['data']):
-                    gid = ground_layer['data'][index]
-                    if gid != 0:
-                        tileset = self.get_tileset_for_gid(gid)
-                        if tileset:
-                            # Calculate tile position
-                            local_tid = gid - tileset.get('firstgid', 0)
-                            tile_x = (local_tid % tileset['columns']) * tileset['tilewidth']
-                            tile_y = (local_tid // tileset['columns']) * tileset['tileheight']
-                            
-                            screen_x = x * tile_width - self.camera_x
-                            screen_y = y * tile_height - self.camera_y
-
-                            # Only render tiles that are visible on screen
-                            if 0 <= screen_x < self.screen.get_width() and 0 <= screen_y < self.screen.get_height():
-                                # Use tile cache for performance
-                                cache_key = f"{tileset['name']}_{local_tid}"
-                                
-                                if cache_key not in self.tile_cache:
-                                    tile_surface = pygame.Surface((tile_width, tile_height), pygame.SRCALPHA)
-                                    tile_surface.blit(tileset['image'], (0, 0),
-                                                      (tile_x, tile_y, tile_width, tile_height))
-                                    self.tile_cache[cache_key] = tile_surface
-                                else:
-                                    tile_surface = self.tile_cache[cache_key]
-                                
-                                self.screen.blit(tile_surface, (screen_x, screen_y))
-
-    def draw_pause_menu(self):
-        """Draw pause menu"""
+    def build_pause_menu(self):
+        """Build the pause menu overlay and text surfaces for the current scale"""
         # Create overlay
         overlay_width = int(400 * self.scale_factor)
         overlay_height = int(300 * self.scale_factor)
         overlay = pygame.Surface((overlay_width, overlay_height), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 180))
-        
-        center_x = self.screen.get_width() // 2
-        center_y = self.screen.get_height() // 2
-        self.screen.blit(overlay, (center_x - overlay_width // 2, center_y - overlay_height // 2))
 
         try:
             title_font = pygame.font.SysFont('Comic Sans MS', int(60 * self.scale_factor), bold=True)
@@ -1010,6 +1076,20 @@ class Game:
         resume_text = option_font.render("Press ESC to Resume", True, (255, 255, 255))
         restart_text = option_font.render("Press R to Restart", True, (255, 255, 255))
         quit_text = option_font.render("Press Q to Quit", True, (255, 255, 255))
+        return overlay, title_text, resume_text, restart_text, quit_text
+
+    def draw_pause_menu(self):
+        """Draw pause menu"""
+        # The menu never changes at a given scale, so build it once and reuse it
+        menu = self._pause_menu_cache.get(self.scale_factor)
+        if menu is None:
+            menu = self.build_pause_menu()
+            self._pause_menu_cache[self.scale_factor] = menu
+        overlay, title_text, resume_text, restart_text, quit_text = menu
+        
+        center_x = self.screen.get_width() // 2
+        center_y = self.screen.get_height() // 2
+        self.screen.blit(overlay, (center_x - overlay.get_width() // 2, center_y - overlay.get_height() // 2))
         
         # Draw text
         self.screen.blit(title_text, (center_x - title_text.get_width() // 2, center_y - 100))
@@ -1035,17 +1115,14 @@ class Game:
         self.camera_y = max(0, min(target_camera_y, max_camera_y))
         
         # Debug: Print camera and player position occasionally
-        if hasattr(self, '_camera_debug_counter'):
+        if self.debug_print:
+            if self._camera_debug_counter % 120 == 0:  # Every 120 frames
+                sys.stdout.write(f"Player: ({self.player.x:.1f}, {self.player.y:.1f})\n"
+                                 f"Camera: ({self.camera_x:.1f}, {self.camera_y:.1f})\n"
+                                 f"Target Camera: ({target_camera_x:.1f}, {target_camera_y:.1f})\n"
+                                 f"Max Camera: ({max_camera_x:.1f}, {max_camera_y:.1f})\n"
+                                 f"Map: {map_width}x{map_height}, Screen: {self.screen_width}x{self.screen_height}\n")
             self._camera_debug_counter += 1
-        else:
-            self._camera_debug_counter = 0
-            
-        if self._camera_debug_counter % 120 == 0:  # Every 120 frames
-            print(f"Player: ({self.player.x:.1f}, {self.player.y:.1f})")
-            print(f"Camera: ({self.camera_x:.1f}, {self.camera_y:.1f})")
-            print(f"Target Camera: ({target_camera_x:.1f}, {target_camera_y:.1f})")
-            print(f"Max Camera: ({max_camera_x:.1f}, {max_camera_y:.1f})")
-            print(f"Map: {map_width}x{map_height}, Screen: {self.screen_width}x{self.screen_height}")
 
 
 if __name__ == "__main__":
@@ -89,6 +89,9 @@ class Inventory:
         self.menu_x = 50
         self.menu_y = 50
         self.item_spacing = 80
+        # Static menu surfaces, rendered on first open
+        self._static = None
+        self._quantity_labels = {}
         
     def add_item(self, item_name, quantity=1):
         """Add item to inventory"""
@@ -111,6 +114,10 @@ class Inventory:
         screen_width = screen.get_width()
         screen_height = screen.get_height()
         
+        if self._static is None:
+            self.build_static_surfaces()
+        static = self._static
+        
         # Calculate center position for inventory
         menu_width = 400
         menu_height = 300
@@ -118,23 +125,18 @@ class Inventory:
         self.menu_y = (screen_height - menu_height) // 2
         
         # Draw background
-        menu_surface = pygame.Surface((menu_width, menu_height))
-        menu_surface.fill((50, 50, 50))
-        menu_surface.set_alpha(200)
-        screen.blit(menu_surface, (self.menu_x, self.menu_y))
+        screen.blit(static['background'], (self.menu_x, self.menu_y))
         
         # Draw border
         pygame.draw.rect(screen, (255, 255, 255), 
                         (self.menu_x, self.menu_y, menu_width, menu_height), 3)
         
         # Draw title
-        font = pygame.font.Font(None, 36)
-        title = font.render("INVENTORY", True, (255, 255, 255))
+        title = static['title']
         title_x = self.menu_x + (menu_width - title.get_width()) // 2
         screen.blit(title, (title_x, self.menu_y + 20))
         
         # Draw items
-        font = pygame.font.Font(None, 24)
         y_offset = 80
         
         for i, (item_name, item) in enumerate(self.items.items()):
@@ -144,49 +146,70 @@ class Inventory:
             # Draw item image
             screen.blit(item.image, (x, y))
             
-            # Draw item name and quantity
-            name_text = font.render(f"{item.name}: {item.quantity}", True, (255, 255, 255))
+            # Draw item name and quantity; only this label changes while the menu is open
+            key = (item_name, item.quantity)
+            name_text = self._quantity_labels.get(key)
+            if name_text is None:
+                name_text = static['font'].render(f"{item.name}: {item.quantity}", True, (255, 255, 255))
+                self._quantity_labels[key] = name_text
             screen.blit(name_text, (x + 40, y))
             
             # Draw description
-            desc_font = pygame.font.Font(None, 18)
-            desc_text = desc_font.render(item.description, True, (200, 200, 200))
-            screen.blit(desc_text, (x + 40, y + 20))
+            screen.blit(static['descriptions'][item_name], (x + 40, y + 20))
             
             # Highlight selected item
             if self.selected_item == item_name:
                 pygame.draw.rect(screen, (255, 255, 0), (x-5, y-5, 170, 60), 3)
         
         # Draw instructions
+        for i, text in enumerate(static['instructions']):
+            text_x = self.menu_x + (menu_width - text.get_width()) // 2
+            screen.blit(text, (text_x, self.menu_y + 250 + i * 20))
+    
+    def build_static_surfaces(self):
+        """Render the menu background, title, descriptions and instructions once"""
+        background = pygame.Surface((400, 300))
+        background.fill((50, 50, 50))
+        background.set_alpha(200)
+        
+        desc_font = pygame.font.Font(None, 18)
         instruction_font = pygame.font.Font(None, 20)
         instructions = [
             "Press 1-4 to use items",
             "Press I to close inventory"
         ]
-        for i, instruction in enumerate(instructions):
-            text = instruction_font.render(instruction, True, (255, 255, 255))
-            text_x = self.menu_x + (menu_width - text.get_width()) // 2
-            screen.blit(text, (text_x, self.menu_y + 250 + i * 20))
+        self._static = {
+            'background': background,
+            'title': pygame.font.Font(None, 36).render("INVENTORY", True, (255, 255, 255)),
+            'font': pygame.font.Font(None, 24),
+            'descriptions': {name: desc_font.render(item.description, True, (200, 200, 200))
+                             for name, item in self.items.items()},
+            'instructions': [instruction_font.render(text, True, (255, 255, 255)) for text in instructions],
+        }
     
-    def handle_input(self, keys, player):
-        """Handle inventory input"""
+    def handle_input(self, pressed, player):
+        """Handle inventory input for the keys pressed this frame"""
         if not self.is_open:
             return
         
         # Use items with number keys
-        if keys[pygame.K_1]:
+        if pygame.K_1 in pressed:
             self.use_item("soap", player)
-        elif keys[pygame.K_2]:
+        elif pygame.K_2 in pressed:
             self.use_item("water", player)
-        elif keys[pygame.K_3]:
+        elif pygame.K_3 in pressed:
             self.use_item("first_aid", player)
-        elif keys[pygame.K_4]:
+        elif pygame.K_4 in pressed:
             self.use_item("trash", player)
     
     def toggle(self):
         """Toggle inventory visibility"""
         self.is_open = not self.is_open
         if self.is_open:
+            if self._static is None:
+                self.build_static_surfaces()
+            # Quantities may have changed while the menu was closed
+            self._quantity_labels.clear()
             print("Inventory opened")
         else:
             print("Inventory closed") 
\ No newline at end of file
@@ -20,7 +20,8 @@ def load_tmx_map(tmx_file):
         data_elem = layer.find('data')
         if data_elem is not None:
             csv_data = data_elem.text.strip()
-            layer_data['data'] = [int(x) for x in csv_data.split(',') if x.strip()]
+            # map() keeps the int() conversion loop in C; int() itself skips the newlines
+            layer_data['data'] = list(map(int, filter(str.strip, csv_data.split(','))))
         layers.append(layer_data)
 
     return {
@@ -30,38 +31,33 @@ def load_tmx_map(tmx_file):
         'tileheight': tile_height,
         'layers': layers  # list of dicts
     }
-def extract_ground_layer(map_data):
-    """Merge 'ground' and 'ground1' into one solid ground layer."""
+def _merge_layers(map_data, names):
+    """Mark every cell that is non-zero in any of the named layers."""
     width = map_data['width']
     height = map_data['height']
-    layers = map_data['layers']
-    solid_layer_names = ['ground', 'ground1']
+    # 'layers' is a list of dicts, so look the wanted ones up by name first
+    layers_by_name = {layer['name']: layer for layer in map_data['layers']}
+
+    grid = [[0] * width for _ in range(height)]
 
-    solid_grid = [[0 for _ in range(width)] for _ in range(height)]
+    for name in names:
+        layer = layers_by_name.get(name)
+        if layer is None:
+            continue
+        data = layer['data']
+        layer_width = layer['width']
+        for y, row in enumerate(grid):
+            start = y * layer_width
+            for x, gid in enumerate(data[start:start + width]):
+                if gid != 0:
+                    row[x] = 1
 
-    for name in solid_layer_names:
-        if name in layers:
-            for y in range(height):
-                for x in range(width):
-                    if layers[name][y][x] != 0:
-                        solid_grid[y][x] = 1
+    return grid
 
-    return solid_grid
+def extract_ground_layer(map_data):
+    """Merge 'ground' and 'ground1' into one solid ground layer."""
+    return _merge_layers(map_data, ['ground', 'ground1'])
 
 def extract_background_layer(map_data):
     """Merge 'background' and 'background1' into one background layer."""
-    width = map_data['width']
-    height = map_data['height']
-    layers = map_data['layers']
-    background_names = ['background', 'background1']
-
-    bg_grid = [[0 for _ in range(width)] for _ in range(height)]
-
-    for name in background_names:
-        if name in layers:
-            for y in range(height):
-                for x in range(width):
-                    if layers[name][y][x] != 0:
-                        bg_grid[y][x] = 1
-
-    return bg_grid
+    return _merge_layers(map_data, ['background', 'background1'])
\ No newline at end of file
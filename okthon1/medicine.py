@@ -2,6 +2,9 @@ import pygame
 import os
 
 class Medicine:
+    # Scaled sprites shared by every medicine, keyed by (width, height)
+    _sprite_cache = {}
+
     def __init__(self, x, y, scale_factor=1.0):
         self.x = x
         self.y = y
@@ -19,6 +22,15 @@ class Medicine:
 
     def load_sprite(self):
         """Load medicine sprite from available items"""
+        key = (self.width, self.height)
+        sprite = Medicine._sprite_cache.get(key)
+        if sprite is None:
+            sprite = self._build_sprite()
+            Medicine._sprite_cache[key] = sprite
+        self.sprite = sprite
+
+    def _build_sprite(self):
+        """Load and scale the sprite, or draw a fallback bottle"""
         # Try to use a suitable medicine-like item from the available sprites
         medicine_paths = [
             'tiled/PNG/Items/platformPack_item005.png',  # Potion-like item
@@ -26,24 +38,22 @@ class Medicine:
             'tiled/PNG/Items/platformPack_item009.png',  # Another option
         ]
         
-        self.sprite = None
         for path in medicine_paths:
             if os.path.exists(path):
                 try:
-                    self.sprite = pygame.image.load(path).convert_alpha()
+                    sprite = pygame.image.load(path).convert_alpha()
                     # Scale the sprite
-                    self.sprite = pygame.transform.scale(self.sprite, (self.width, self.height))
-                    break
+                    return pygame.transform.scale(sprite, (self.width, self.height))
                 except Exception as e:
                     continue
         
         # If no sprite found, create a fallback
-        if self.sprite is None:
-            self.sprite = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            # Create a simple medicine bottle shape
-            pygame.draw.rect(self.sprite, (255, 255, 255), (0, 0, self.width, self.height))
-            pygame.draw.rect(self.sprite, (0, 255, 0), (4, 4, self.width-8, self.height-8))  # Green medicine
-            pygame.draw.rect(self.sprite, (0, 200, 0), (8, 8, self.width-16, 8))  # Bottle cap
+        sprite = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        # Create a simple medicine bottle shape
+        pygame.draw.rect(sprite, (255, 255, 255), (0, 0, self.width, self.height))
+        pygame.draw.rect(sprite, (0, 255, 0), (4, 4, self.width-8, self.height-8))  # Green medicine
+        pygame.draw.rect(sprite, (0, 200, 0), (8, 8, self.width-16, 8))  # Bottle cap
+        return sprite
 
     def check_collision(self, player):
         """Check if player has collected this medicine"""
@@ -63,6 +73,21 @@ class Medicine:
             screen_y = self.y - camera_y
             screen.blit(self.sprite, (screen_x, screen_y))
 
+    @classmethod
+    def blit_list(cls, medicines, camera_x, camera_y, view_w, view_h):
+        """Get (sprite, position) pairs for the uncollected medicines inside the view, ready for Surface.blits"""
+        pairs = []
+        append = pairs.append
+        for medicine in medicines:
+            if medicine.collected:
+                continue
+            dx = int(medicine.x - camera_x)
+            dy = int(medicine.y - camera_y)
+            if dx + medicine.width < 0 or dx > view_w or dy + medicine.height < 0 or dy > view_h:
+                continue
+            append((medicine.sprite, (dx, dy)))
+        return pairs
+
     @property
     def rect(self):
         """Get medicine rectangle for collision detection"""
@@ -1,7 +1,43 @@
 import pygame
 import os
 
+# pygame names used every frame, looked up once instead of through the module each time
+_get_pressed = pygame.key.get_pressed
+_Rect = pygame.Rect
+_K_A = pygame.K_a
+_K_D = pygame.K_d
+_K_F = pygame.K_f
+_K_LEFT = pygame.K_LEFT
+_K_RIGHT = pygame.K_RIGHT
+_K_SPACE = pygame.K_SPACE
+
 class NPC:
+    __slots__ = ('x', 'y', 'scale_factor', 'width', 'height',
+                 'vel_x', 'vel_y', 'speed', 'jump_speed', 'gravity', 'on_ground', 'jump_count', 'max_jumps',
+                 'facing_right', 'is_dashing', 'dash_timer', 'dash_duration', 'dash_cooldown',
+                 'dash_cooldown_timer', 'dash_speed',
+                 'health', 'max_health', 'lives', 'is_clean', 'clean_timer', 'dirt_timer',
+                 'health_drain_timer', 'health_drain_interval', 'health_drain_amount',
+                 'last_walk_sound', 'walk_sound_interval', 'last_jump_sound', 'jump_sound_cooldown', 'game_sounds',
+                 'has_quest', 'quest_completed', 'quest_accepted', 'interaction_range', 'debug_print',
+                 'sprite_frames', 'current_sprite',
+                 'quest_title', 'quest_description', 'required_items', 'collected_items',
+                 'animation_index', 'animation_timer', 'animation_speed', 'state')
+
+    # Scaled sprite frames shared by every NPC, keyed by (path, width, height)
+    _sprite_cache = {}
+
+    # Dialogue, the same for every NPC
+    dialogue_lines = {
+        'greeting': "Hello traveler! I am in need of your help.",
+        'quest_offer': "The villagers are sick and need medicine. Can you collect 3 medicine items for me?",
+        'quest_accepted': "Thank you! Please find the medicine items scattered around the map.",
+        # Template, filled in with the current progress when the line is shown
+        'quest_in_progress': "You have collected {collected}/{required} medicine items.",
+        'quest_complete': "Excellent! You've collected all the medicine. The villagers will be grateful!",
+        'quest_finished': "Thank you again for your help. The village is in your debt."
+    }
+
     def __init__(self, x, y, scale_factor=1.0):
         self.x = x
         self.y = y
@@ -51,6 +87,7 @@ class NPC:
         self.quest_completed = False
         self.quest_accepted = False
         self.interaction_range = 80 * scale_factor
+        self.debug_print = False  # Log landings and cleanliness changes to stdout
         
         # Load NPC sprite (using the same character sprites as player)
         self.load_sprites()
@@ -62,23 +99,11 @@ class NPC:
         self.required_items = 3
         self.collected_items = 0
         
-        # Dialogue
-        self.dialogue_lines = {
-            'greeting': "Hello traveler! I am in need of your help.",
-            'quest_offer': "The villagers are sick and need medicine. Can you collect 3 medicine items for me?",
-            'quest_accepted': "Thank you! Please find the medicine items scattered around the map.",
-            'quest_in_progress': f"You have collected {self.collected_items}/{self.required_items} medicine items.",
-            'quest_complete': "Excellent! You've collected all the medicine. The villagers will be grateful!",
-            'quest_finished': "Thank you again for your help. The village is in your debt."
-        }
-        
         # Animation
         self.animation_index = 0
         self.animation_timer = 0
         self.animation_speed = 0.15
         self.state = 'idle'
-        self.animation_timer = 0
-        self.animation_index = 0
 
     def load_sprites(self):
         """Load NPC sprites (using character sprites)"""
@@ -108,29 +133,25 @@ class NPC:
         for key, path in sprite_paths.items():
             if isinstance(path, list):
                 # Multiple frames for animation
-                frames = []
-                for p in path:
-                    if os.path.exists(p):
-                        sprite = pygame.image.load(p).convert_alpha()
-                        scaled_sprite = pygame.transform.scale(sprite, (self.width, self.height))
-                        frames.append(scaled_sprite)
-                    else:
-                        # Fallback sprite
-                        fallback_surface = pygame.Surface((self.width, self.height))
-                        fallback_surface.fill((0, 255, 0))  # Green for NPC
-                        frames.append(fallback_surface)
-                self.sprite_frames[key] = frames
+                self.sprite_frames[key] = [self.load_frame(p) for p in path]
             else:
                 # Single frame
-                if os.path.exists(path):
-                    sprite = pygame.image.load(path).convert_alpha()
-                    scaled_sprite = pygame.transform.scale(sprite, (self.width, self.height))
-                    self.sprite_frames[key] = [scaled_sprite]
-                else:
-                    # Fallback sprite
-                    fallback_surface = pygame.Surface((self.width, self.height))
-                    fallback_surface.fill((0, 255, 0))  # Green for NPC
-                    self.sprite_frames[key] = [fallback_surface]
+                self.sprite_frames[key] = [self.load_frame(path)]
+
+    def load_frame(self, path):
+        """Load and scale one sprite frame, or a fallback, sharing it with other NPCs of the same size"""
+        key = (path, self.width, self.height)
+        frame = NPC._sprite_cache.get(key)
+        if frame is None:
+            if os.path.exists(path):
+                sprite = pygame.image.load(path).convert_alpha()
+                frame = pygame.transform.scale(sprite, (self.width, self.height))
+            else:
+                # Fallback sprite
+                frame = pygame.Surface((self.width, self.height))
+                frame.fill((0, 255, 0))  # Green for NPC
+            NPC._sprite_cache[key] = frame
+        return frame
 
     def play_sound(self, sound_name, game_sounds):
         """Play a sound effect if available"""
@@ -142,26 +163,27 @@ class NPC:
 
     def update(self, dt, collision_grid, climb_grid):
         """Update NPC logic with player movement"""
-        # Handle input
-        keys = pygame.key.get_pressed()
+        # Handle input: read every key once for this frame
+        keys = _get_pressed()
+        dash = keys[_K_D]
+        left = keys[_K_A] or keys[_K_LEFT]
+        right = dash or keys[_K_RIGHT]
         
         # Handle normal movement
-        self.handle_normal_movement(keys, dt)
+        self.handle_normal_movement(left, right, keys[_K_SPACE], dash, dt)
         
         # Handle knife throwing
-        self.handle_knife_throwing(keys)
-        
-        # Apply gravity
-        self.vel_y += self.gravity * dt
+        self.handle_knife_throwing(keys[_K_F])
         
-        # Update position
+        # Apply gravity, then move with the new vertical speed (semi-implicit Euler)
+        vel_y = self.vel_y + self.gravity * dt
+        self.vel_y = vel_y
         self.x += self.vel_x * dt
-        self.y += self.vel_y * dt
+        self.y += vel_y * dt
         
         # Check collisions
         if collision_grid:
-            self.check_horizontal_collisions(collision_grid)
-            self.check_vertical_collisions(collision_grid)
+            self.check_collisions(collision_grid)
         
         # Update animation
         self.update_animation(dt)
@@ -175,20 +197,20 @@ class NPC:
         if self.dash_cooldown_timer > 0:
             self.dash_cooldown_timer -= dt
 
-    def handle_normal_movement(self, keys, dt):
+    def handle_normal_movement(self, left, right, jump, dash, dt):
         """Handle normal movement input"""
         # Horizontal movement
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
+        if left:
             self.vel_x = -self.speed
             self.facing_right = False
-        elif keys[pygame.K_d] or keys[pygame.K_RIGHT]:
+        elif right:
             self.vel_x = self.speed
             self.facing_right = True
         else:
             self.vel_x = 0
         
         # Jumping
-        if keys[pygame.K_SPACE] and self.on_ground:
+        if jump and self.on_ground:
             self.vel_y = self.jump_speed
             self.on_ground = False
             self.jump_count += 1
@@ -196,7 +218,7 @@ class NPC:
             self.play_sound('jump', getattr(self, 'game_sounds', {}))
         
         # Dashing
-        if keys[pygame.K_d] and not self.is_dashing and self.dash_cooldown_timer <= 0:
+        if dash and not self.is_dashing and self.dash_cooldown_timer <= 0:
             self.is_dashing = True
             self.dash_timer = self.dash_duration
             self.dash_cooldown_timer = self.dash_cooldown
@@ -208,71 +230,84 @@ class NPC:
                 self.play_sound('walk', getattr(self, 'game_sounds', {}))
                 self.last_walk_sound = 0
 
-    def handle_knife_throwing(self, keys):
+    def handle_knife_throwing(self, throw):
         """Handle knife throwing input"""
-        if keys[pygame.K_f]:
+        if throw:
             # Knife throwing logic would go here
             pass
 
-    def check_horizontal_collisions(self, tiles):
-        """Check horizontal collisions with tiles"""
-        player_rect = pygame.Rect(self.x, self.y, self.width, self.height)
+    def check_collisions(self, tiles):
+        """Resolve horizontal then vertical collisions with the tiles around the NPC"""
+        if not self.vel_x and not self.vel_y:
+            # Nothing to push back and no landing without downward speed, so the
+            # passes below could only clear on_ground (the gravity-free quest giver)
+            self.on_ground = False
+            return
         tile_size = 32  # Updated to match TMX tile size
         
-        # Only check tiles near the player to improve performance
-        player_tile_x = int(self.x // tile_size)
-        player_tile_y = int(self.y // tile_size)
+        # Only check tiles near the NPC to improve performance; the row range is
+        # shared by both passes since horizontal resolution never moves y
+        x = self.x
+        y = self.y
+        width = self.width
+        height = self.height
+        columns = len(tiles[0])
+        tile_x = int(x // tile_size)
+        tile_y = int(y // tile_size)
+        start_y = max(0, tile_y - 2)
+        end_y = min(len(tiles), tile_y + 4)
+        solid = self.solid_tiles_near(tiles, tile_x, start_y, end_y, columns, tile_size)
         
-        # Check a smaller area around the player
-        start_x = max(0, player_tile_x - 2)
-        end_x = min(len(tiles[0]), player_tile_x + 4)
-        start_y = max(0, player_tile_y - 2)
-        end_y = min(len(tiles), player_tile_y + 4)
+        # Horizontal pass, against the NPC box in integer pixels (truncated like pygame.Rect)
+        vel_x = self.vel_x
+        left = int(x)
+        top = int(y)
+        right = left + width
+        bottom = top + height
+        for tile_left, tile_top in solid:
+            if left < tile_left + tile_size and right > tile_left and top < tile_top + tile_size and bottom > tile_top:
+                if vel_x > 0:
+                    x = tile_left - width
+                elif vel_x < 0:
+                    x = tile_left + tile_size
+        self.x = x
         
-        for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                if y < len(tiles) and x < len(tiles[0]):
-                    tile_gid = tiles[y][x]
-                    if tile_gid != 0:
-                        tile_rect = pygame.Rect(x * tile_size, y * tile_size, tile_size, tile_size)
-                        if player_rect.colliderect(tile_rect):
-                            if self.vel_x > 0:
-                                self.x = tile_rect.left - self.width
-                            elif self.vel_x < 0:
-                                self.x = tile_rect.right
-
-    def check_vertical_collisions(self, tiles):
-        """Check vertical collisions with tiles"""
+        # Vertical pass; the column window follows x if the horizontal pass moved it
         self.on_ground = False
-        player_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        tile_size = 32  # Updated to match TMX tile size
-        
-        # Only check tiles near the player to improve performance
-        player_tile_x = int(self.x // tile_size)
-        player_tile_y = int(self.y // tile_size)
-        
-        # Check a smaller area around the player
-        start_x = max(0, player_tile_x - 2)
-        end_x = min(len(tiles[0]), player_tile_x + 4)
-        start_y = max(0, player_tile_y - 2)
-        end_y = min(len(tiles), player_tile_y + 4)
-        
+        if int(x // tile_size) != tile_x:
+            solid = self.solid_tiles_near(tiles, int(x // tile_size), start_y, end_y, columns, tile_size)
+        vel_y = self.vel_y
+        left = int(x)
+        right = left + width
+        for tile_left, tile_top in solid:
+            if left < tile_left + tile_size and right > tile_left and top < tile_top + tile_size and bottom > tile_top:
+                # Either branch stops the NPC, after which no other tile can move it
+                if vel_y > 0:
+                    self.y = tile_top - height
+                    self.vel_y = 0
+                    self.on_ground = True
+                    self.jump_count = 0
+                    if self.debug_print:
+                        print(f"NPC landed on ground at Y={self.y}")
+                    break
+                elif vel_y < 0:
+                    self.y = tile_top + tile_size
+                    self.vel_y = 0
+                    break
+
+    def solid_tiles_near(self, tiles, tile_x, start_y, end_y, columns, tile_size):
+        """Get the pixel origin of every solid tile in the window around a tile column"""
+        start_x = max(0, tile_x - 2)
+        end_x = min(columns, tile_x + 4)
+        solid = []
+        append = solid.append
         for y in range(start_y, end_y):
+            row = tiles[y]
+            tile_top = y * tile_size
             for x in range(start_x, end_x):
-                if y < len(tiles) and x < len(tiles[0]):
-                    tile_gid = tiles[y][x]
-                    if tile_gid != 0:
-                        tile_rect = pygame.Rect(x * tile_size, y * tile_size, tile_size, tile_size)
-                        if player_rect.colliderect(tile_rect):
-                            if self.vel_y > 0:
-                                self.y = tile_rect.top - self.height
-                                self.vel_y = 0
-                                self.on_ground = True
-                                self.jump_count = 0
-                                print(f"NPC landed on ground at Y={self.y}")
-                            elif self.vel_y < 0:
-                                self.y = tile_rect.bottom
-                                self.vel_y = 0
+                if row[x]:
+                    append((x * tile_size, tile_top))
+        return solid
 
     def update_animation(self, dt):
         """Update animation state and timing"""
@@ -280,37 +315,38 @@ class NPC:
         
         # Determine animation state
         if not self.on_ground:
-            self.state = 'jump'
+            state = 'jump'
         elif abs(self.vel_x) > 5:
-            self.state = 'run'
+            state = 'run'
         else:
-            self.state = 'idle'
+            state = 'idle'
+        self.state = state
+        frames = self.sprite_frames.get(state) or self.sprite_frames['idle']
         
         # Update animation frame
+        index = self.animation_index
         if self.animation_timer >= self.animation_speed:
             self.animation_timer = 0
-            if self.state in self.sprite_frames:
-                self.animation_index = (self.animation_index + 1) % len(self.sprite_frames[self.state])
-            else:
-                self.animation_index = 0
-        
-        # Get current sprite
-        if self.state in self.sprite_frames:
-            self.current_sprite = self.sprite_frames[self.state][self.animation_index]
-        else:
-            self.current_sprite = self.sprite_frames['idle'][0]
+            index = (index + 1) % len(frames)
+        elif index >= len(frames):
+            # Switched to a state with fewer frames since the last tick
+            index = 0
+        self.animation_index = index
+        self.current_sprite = frames[index]
 
     def make_dirty(self):
         """Make the NPC dirty"""
         self.is_clean = False
         self.dirt_timer = 30.0
-        print("NPC got dirty!")
+        if self.debug_print:
+            print("NPC got dirty!")
 
     def make_clean(self):
         """Make the NPC clean"""
         self.is_clean = True
         self.clean_timer = 30.0
-        print("NPC is now clean!")
+        if self.debug_print:
+            print("NPC is now clean!")
 
     def update_quest_progress(self, player):
         """Update quest progress based on player's collected items"""
@@ -319,8 +355,11 @@ class NPC:
 
     def is_player_nearby(self, player):
         """Check if player is within interaction range"""
-        distance = ((player.x - self.x) ** 2 + (player.y - self.y) ** 2) ** 0.5
-        return distance <= self.interaction_range
+        # Compare squared distances to skip the sqrt
+        dx = player.x - self.x
+        dy = player.y - self.y
+        interaction_range = self.interaction_range
+        return dx * dx + dy * dy <= interaction_range * interaction_range
 
     def get_dialogue(self, player):
         """Get appropriate dialogue based on quest state"""
@@ -328,7 +367,9 @@ class NPC:
             return [("NPC", self.dialogue_lines['greeting']),
                    ("NPC", self.dialogue_lines['quest_offer'])]
         elif self.quest_accepted and not self.quest_completed:
-            return [("NPC", self.dialogue_lines['quest_in_progress'])]
+            progress = self.dialogue_lines['quest_in_progress'].format(collected=self.collected_items,
+                                                                      required=self.required_items)
+            return [("NPC", progress)]
         else:
             return [("NPC", self.dialogue_lines['quest_finished'])]
 
@@ -349,4 +390,4 @@ class NPC:
     @property
     def rect(self):
         """Get the NPC's rectangle for collision detection"""
-        return pygame.Rect(self.x, self.y, self.width, self.height) 
\ No newline at end of file
+        return _Rect(self.x, self.y, self.width, self.height) 
\ No newline at end of file
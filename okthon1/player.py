@@ -3,6 +3,10 @@ import os
 from entities import Knife
 
 class Player:
+    # Scaled sprite frames shared by every Player, keyed by (path, width, height);
+    # the missing-sprite fallback is stored under a path of None
+    _sprite_cache = {}
+
     def __init__(self, x, y, scale_factor=0.75):
         """Initialize player"""
         self.x = x
@@ -10,6 +14,8 @@ class Player:
         self.scale_factor = scale_factor
         self.width = int(32 * scale_factor)
         self.height = int(32 * scale_factor)
+        # Collision rectangle, reused by the rect property instead of building one per access
+        self._rect = pygame.Rect(int(x), int(y), self.width, self.height)
         
         # Player physics
         self.vel_x = 0
@@ -47,12 +53,15 @@ class Player:
         self.health_drain_interval = 20.0  # Drain health every 20 seconds when dirty
         self.health_drain_amount = 10  # Drain 10 health points
         
+        self.debug_print = False  # Log sprite loading and health/cleanliness changes to stdout
+        self._logged_no_tiles = False
+        
         # Load sprites
         self.load_sprites()
         
         # Animation
-        self.animation_index = 0
-        self.animation_timer = 0
+        self.animation_time = 0  # Seconds spent in animated states since the player was last idle
+        self.animation_fps = 10  # Frames per second for the walk, run and jump cycles
         self.animation_speed = 0.15  # Much slower animation speed
         
         # Direction
@@ -100,16 +109,21 @@ class Player:
         
         # Handle idle sprite (single image)
         if os.path.exists(sprite_paths['idle']):
-            sprite = pygame.image.load(sprite_paths['idle']).convert_alpha()
-            scaled_sprite = pygame.transform.scale(sprite, (self.width, self.height))
+            scaled_sprite = self.load_frame(sprite_paths['idle'])
             self.sprite_frames['idle'] = [scaled_sprite]
-            print(f"Loaded player sprite: {sprite_paths['idle']} -> Size: {scaled_sprite.get_width()}x{scaled_sprite.get_height()}")
+            if self.debug_print:
+                print(f"Loaded player sprite: {sprite_paths['idle']} -> Size: {scaled_sprite.get_width()}x{scaled_sprite.get_height()}")
         else:
-            # Create a simple colored rectangle as fallback
-            fallback_surface = pygame.Surface((self.width, self.height))
-            fallback_surface.fill((255, 0, 0))  # Red rectangle
+            # Create a simple colored rectangle as fallback, shared by every player of this size
+            key = (None, self.width, self.height)
+            fallback_surface = Player._sprite_cache.get(key)
+            if fallback_surface is None:
+                fallback_surface = pygame.Surface((self.width, self.height))
+                fallback_surface.fill((255, 0, 0))  # Red rectangle
+                Player._sprite_cache[key] = fallback_surface
             self.sprite_frames['idle'] = [fallback_surface]
-            print(f"Created fallback sprite: {self.width}x{self.height}")
+            if self.debug_print:
+                print(f"Created fallback sprite: {self.width}x{self.height}")
         
         # Handle animated sprites
         for key, paths in sprite_paths.items():
@@ -119,11 +133,8 @@ class Player:
             frames = []
             for path in paths:
                 if os.path.exists(path):
-                    # Load individual sprite frame
-                    sprite = pygame.image.load(path).convert_alpha()
-                    # Scale the sprite to player size
-                    scaled_sprite = pygame.transform.scale(sprite, (self.width, self.height))
-                    frames.append(scaled_sprite)
+                    # Load individual sprite frame; repeated paths reuse the same surface
+                    frames.append(self.load_frame(path))
             
             if frames:
                 self.sprite_frames[key] = frames
@@ -133,6 +144,16 @@ class Player:
 
         self.current_sprite = self.sprite_frames['idle'][0]
 
+    def load_frame(self, path):
+        """Load a sprite frame scaled to player size, decoding each path once per size"""
+        key = (path, self.width, self.height)
+        frame = Player._sprite_cache.get(key)
+        if frame is None:
+            sprite = pygame.image.load(path).convert_alpha()
+            frame = pygame.transform.scale(sprite, (self.width, self.height))
+            Player._sprite_cache[key] = frame
+        return frame
+
     def play_sound(self, sound_name, game_sounds):
         """Play a sound effect if available"""
         if sound_name in game_sounds:
@@ -141,10 +162,11 @@ class Player:
             except:
                 pass  # Ignore sound errors
 
-    def update(self, dt, ground_tiles, climb_tiles):
+    def update(self, dt, ground_tiles, climb_tiles, keys=None):
         """Update player physics and input"""
-        # Handle input
-        keys = pygame.key.get_pressed()
+        # Handle input; callers that already polled this frame can pass their snapshot
+        if keys is None:
+            keys = pygame.key.get_pressed()
         
         # Handle normal movement
         self.handle_normal_movement(keys, dt)
@@ -162,27 +184,32 @@ class Player:
         
         # Clamp player to map boundaries
         map_width = 1920  # 60 tiles * 32 pixels
-        map_height = 960  # 30 tiles * 32 pixels
         
         # Clamp X position
         self.x = max(0, min(self.x, map_width - self.width))
         
-        # Clamp Y position
-        self.y = max(0, min(self.y, map_height - self.height))
-        
-        # Clamp player position to map bounds
-        ground_level = 928  # Ground is at Y=29 * 32 = 928 pixels
-        if self.y > ground_level:
-            self.y = ground_level - self.height  # Position player on top of ground
-            self.vel_y = 0
-            self.on_ground = True
+        # Clamp Y position to the top of the map; the ground snap below handles the bottom
+        if self.y < 0:
+            self.y = 0
         
         # Check collisions
         if ground_tiles:
             self.check_horizontal_collisions(ground_tiles)
             self.check_vertical_collisions(ground_tiles)
-        else:
+        elif not self._logged_no_tiles:
+            # Report a missing grid once rather than every frame
             print("No collision grid provided!")
+            self._logged_no_tiles = True
+        
+        # Snap onto the ground, landing anything falling to within 2 pixels of it; a player
+        # resting exactly on it never overlaps the ground tiles, so the tile collision
+        # alone would not keep them on_ground
+        ground_y = 928 - self.height  # Ground is at Y=29 * 32 = 928 pixels
+        if self.y >= ground_y - 2 and self.vel_y >= 0:
+            self.y = ground_y
+            self.vel_y = 0
+            self.on_ground = True
+            self.jump_count = 0
         
         # Update dash
         if self.is_dashing:
@@ -199,15 +226,17 @@ class Player:
         # Update animation
         self.update_animation(dt)
         
-        # Update knives
-        for knife in self.knives_thrown[:]:
-            knife['x'] += knife['vel_x'] * dt
-            knife['y'] += knife['vel_y'] * dt
-            knife['timer'] -= dt
-            
-            # Remove knives that have expired
-            if knife['timer'] <= 0:
-                self.knives_thrown.remove(knife)
+        # Update knives, keeping the live ones in a single pass instead of copying
+        # the list and removing expired knives one search at a time
+        if self.knives_thrown:
+            live = []
+            for knife in self.knives_thrown:
+                knife['x'] += knife['vel_x'] * dt
+                knife['y'] += knife['vel_y'] * dt
+                knife['timer'] -= dt
+                if knife['timer'] > 0:
+                    live.append(knife)
+            self.knives_thrown[:] = live
 
     def update_health_system(self, dt):
         """Update health and cleanliness system"""
@@ -216,7 +245,8 @@ class Player:
             self.dirt_timer -= dt
             if self.dirt_timer <= 0:
                 self.is_dirty = False
-                print("You are no longer dirty!")
+                if self.debug_print:
+                    print("You are no longer dirty!")
         
         # Update health drain when dirty
         if self.is_dirty:
@@ -224,35 +254,24 @@ class Player:
             if self.health_drain_timer >= self.health_drain_interval:
                 self.health_drain_timer = 0
                 self.max_health = max(0, self.max_health - self.health_drain_amount)
-                print(f"Health drained by {self.health_drain_amount} due to dirtiness!")
-                if self.max_health <= 0:
-                    print("You died from dirtiness!")
+                if self.debug_print:
+                    print(f"Health drained by {self.health_drain_amount} due to dirtiness!")
+                    if self.max_health <= 0:
+                        print("You died from dirtiness!")
     
     def make_dirty(self):
         """Make the player dirty"""
         self.is_dirty = True
         self.dirt_timer = 0.0
-        print("You got dirty!")
+        if self.debug_print:
+            print("You got dirty!")
     
     def clean_up(self):
         """Clean the player"""
         self.is_dirty = False
         self.dirt_timer = 30.0  # 30 seconds of cleanliness
-        print("You are now clean!")
-
-    def handle_dash(self, keys, dt):
-        """Handle dash mechanics"""
-        if keys[pygame.K_d] and not self.is_dashing and self.dash_cooldown_timer <= 0:
-            self.is_dashing = True
-            self.dash_timer = self.dash_duration
-            self.dash_cooldown_timer = self.dash_cooldown
-
-        if self.is_dashing:
-            dash_direction = 1 if self.facing_right else -1
-            self.x += dash_direction * self.dash_speed
-            self.dash_timer -= dt
-            if self.dash_timer <= 0:
-                self.is_dashing = False
+        if self.debug_print:
+            print("You are now clean!")
 
     def handle_normal_movement(self, keys, dt):
         """Handle normal movement with direct input response"""
@@ -341,12 +360,14 @@ class Player:
 
     @property
     def rect(self):
-        """Get player rectangle for collision detection"""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        """Get player rectangle for collision detection, synced in place from x/y"""
+        rect = self._rect
+        rect.x = int(self.x)
+        rect.y = int(self.y)
+        return rect
 
     def check_horizontal_collisions(self, tiles):
         """Check horizontal collisions with tiles"""
-        player_rect = pygame.Rect(self.x, self.y, self.width, self.height)
         tile_size = 32  # Updated to match TMX tile size
         
         # Only check tiles near the player to improve performance
@@ -359,22 +380,32 @@ class Player:
         start_y = max(0, player_tile_y - 2)
         end_y = min(len(tiles), player_tile_y + 4)
         
+        # Player box in integer pixels, truncated like pygame.Rect and fixed for the whole scan
+        left = int(self.x)
+        top = int(self.y)
+        right = left + self.width
+        bottom = top + self.height
+        
+        # Walk each window row as a slice and only look at solid tiles; the slice
+        # already stops at the grid edge, so no per-tile bounds check is needed.
+        # The grid is a solid/empty mask, so rows with nothing solid are skipped whole
         for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                if y < len(tiles) and x < len(tiles[0]):
-                    tile_gid = tiles[y][x]
-                    if tile_gid != 0:
-                        tile_rect = pygame.Rect(x * tile_size, y * tile_size, tile_size, tile_size)
-                        if player_rect.colliderect(tile_rect):
-                            if self.vel_x > 0 or self.is_dashing:
-                                self.x = tile_rect.left - self.width
-                            elif self.vel_x < 0 or self.is_dashing:
-                                self.x = tile_rect.right
+            row = tiles[y][start_x:end_x]
+            if not any(row):
+                continue
+            for x, tile_gid in enumerate(row, start_x):
+                if tile_gid:
+                    tile_left = x * tile_size
+                    tile_top = y * tile_size
+                    if left < tile_left + tile_size and right > tile_left and top < tile_top + tile_size and bottom > tile_top:
+                        if self.vel_x > 0 or self.is_dashing:
+                            self.x = tile_left - self.width
+                        elif self.vel_x < 0 or self.is_dashing:
+                            self.x = tile_left + tile_size
 
     def check_vertical_collisions(self, tiles):
         """Check vertical collisions with tiles"""
         self.on_ground = False
-        player_rect = pygame.Rect(self.x, self.y, self.width, self.height)
         tile_size = 32  # Updated to match TMX tile size
         
         # Only check tiles near the player to improve performance
@@ -387,33 +418,32 @@ class Player:
         start_y = max(0, player_tile_y - 3)
         end_y = min(len(tiles), player_tile_y + 5)
         
+        # Player box in integer pixels, truncated like pygame.Rect and fixed for the whole scan
+        left = int(self.x)
+        top = int(self.y)
+        right = left + self.width
+        bottom = top + self.height
+        
+        # Walk each window row as a slice and only look at solid tiles
         for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                if y < len(tiles) and x < len(tiles[0]):
-                    tile_gid = tiles[y][x]
-                    if tile_gid != 0:
-                        tile_rect = pygame.Rect(x * tile_size, y * tile_size, tile_size, tile_size)
-                        if player_rect.colliderect(tile_rect):
-                            if self.vel_y > 0:
-                                # Landing on top of a tile
-                                self.y = tile_rect.top - self.height
-                                self.vel_y = 0
-                                self.on_ground = True
-                                self.jump_count = 0
-                            elif self.vel_y < 0:
-                                # Hitting head on a tile
-                                self.y = tile_rect.bottom
-                                self.vel_y = 0
-        
-        # Additional check: if player is very close to ground, consider them on ground
-        if not self.on_ground and self.vel_y >= 0:
-            # Check if player is within 2 pixels of the ground
-            ground_y = 928  # Ground level
-            if abs(self.y + self.height - ground_y) <= 2:
-                self.y = ground_y - self.height
-                self.vel_y = 0
-                self.on_ground = True
-                self.jump_count = 0
+            row = tiles[y][start_x:end_x]
+            if not any(row):
+                continue
+            for x, tile_gid in enumerate(row, start_x):
+                if tile_gid:
+                    tile_left = x * tile_size
+                    tile_top = y * tile_size
+                    if left < tile_left + tile_size and right > tile_left and top < tile_top + tile_size and bottom > tile_top:
+                        if self.vel_y > 0:
+                            # Landing on top of a tile
+                            self.y = tile_top - self.height
+                            self.vel_y = 0
+                            self.on_ground = True
+                            self.jump_count = 0
+                        elif self.vel_y < 0:
+                            # Hitting head on a tile
+                            self.y = tile_top + tile_size
+                            self.vel_y = 0
 
     def update_animation(self, dt):
         """Update animation state and current sprite"""
@@ -425,35 +455,13 @@ class Player:
         else:
             state = 'idle'
         
-        # Only update animation timer for animated states (not idle)
-        if state != 'idle':
-            self.animation_timer += dt
-            
-            # Slower animation speed
-            if self.animation_timer >= 0.1:  # Much slower animation
-                self.animation_timer = 0
-                if state in self.sprite_frames and self.sprite_frames[state]:
-                    self.animation_index = (self.animation_index + 1) % len(self.sprite_frames[state])
+        # load_sprites always fills every state, falling back to the idle frame
+        if state == 'idle':
+            # For idle, always use the first frame and restart the cycle
+            self.animation_time = 0
+            self.current_sprite = self.sprite_frames['idle'][0]
         else:
-            # For idle, always use the first frame and reset animation
-            self.animation_index = 0
-            self.animation_timer = 0
-        
-        # Set current sprite
-        if state in self.sprite_frames and self.sprite_frames[state]:
-            if state == 'idle':
-                # For idle, always use the first (and only) frame
-                self.current_sprite = self.sprite_frames[state][0]
-            else:
-                # For animated states, ensure index is within bounds
-                if self.animation_index >= len(self.sprite_frames[state]):
-                    self.animation_index = 0
-                self.current_sprite = self.sprite_frames[state][self.animation_index]
-        else:
-            # Fallback to idle sprite
-            if 'idle' in self.sprite_frames and self.sprite_frames['idle']:
-                self.current_sprite = self.sprite_frames['idle'][0]
-            else:
-                # Create a fallback sprite if no sprites are loaded
-                self.current_sprite = pygame.Surface((self.width, self.height))
-                self.current_sprite.fill((255, 0, 0))
+            # The frame follows directly from the time spent animating
+            self.animation_time += dt
+            frames = self.sprite_frames[state]
+            self.current_sprite = frames[int(self.animation_time * self.animation_fps) % len(frames)]
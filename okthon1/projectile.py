@@ -0,0 +1,83 @@
+import pygame
+import math
+
+class Projectile:
+    __slots__ = ('x', 'y', 'width', 'height', 'vel_x', 'vel_y', 'image', '_rect')
+
+    # Shared bullet image, built on first use
+    _image = None
+
+    def __init__(self, x, y, target_x, target_y, speed=400):
+        self.width = 10
+        self.height = 10
+        if Projectile._image is None:
+            # Built lazily so the display exists for convert_alpha()
+            image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            pygame.draw.circle(image, (255, 60, 0), (self.width // 2, self.height // 2), self.width // 2)
+            Projectile._image = image.convert_alpha()
+        self.image = Projectile._image
+        self._rect = pygame.Rect(0, 0, self.width, self.height)
+        self.reset(x, y, target_x, target_y, speed)
+
+    def reset(self, x, y, target_x, target_y, speed=400):
+        """Re-aim the projectile from a new position so it can be reused"""
+        self.x = x
+        self.y = y
+        # Aim directly at the target
+        dx = target_x - x
+        dy = target_y - y
+        distance = math.hypot(dx, dy) or 1
+        self.vel_x = dx / distance * speed
+        self.vel_y = dy / distance * speed
+        self._rect.x = int(x)
+        self._rect.y = int(y)
+
+    def update(self, dt):
+        self.x += self.vel_x * dt
+        self.y += self.vel_y * dt
+        self._rect.x = int(self.x)
+        self._rect.y = int(self.y)
+
+    def off_screen(self):
+        return self.x < 0 or self.x > 2000 or self.y < 0 or self.y > 1000  # Roughly the map size
+
+    def get_rect(self):
+        return self._rect
+
+class ProjectileSystem:
+    """Owns every projectile in the game and steps them in one pass"""
+    def __init__(self):
+        self.active = []
+        self._free = []  # Retired projectiles waiting to be reused
+
+    def spawn(self, x, y, target_x, target_y):
+        """Fire a projectile, reusing a retired one when possible"""
+        if self._free:
+            proj = self._free.pop()
+            proj.reset(x, y, target_x, target_y)
+        else:
+            proj = Projectile(x, y, target_x, target_y)
+        self.active.append(proj)
+        return proj
+
+    def update(self, dt):
+        """Move all projectiles and drop off-screen ones in place"""
+        projs = self.active
+        for i in range(len(projs) - 1, -1, -1):
+            proj = projs[i]
+            proj.x += proj.vel_x * dt
+            proj.y += proj.vel_y * dt
+            proj._rect.x = int(proj.x)
+            proj._rect.y = int(proj.y)
+            if proj.off_screen():
+                projs[i] = projs[-1]
+                projs.pop()
+                self._free.append(proj)
+
+    def draw(self, screen, camera_x, camera_y):
+        """Draw all projectiles with a single batched blit"""
+        projs = self.active
+        if projs:
+            cam_x = int(camera_x)
+            cam_y = int(camera_y)
+            screen.blits([(p.image, (int(p.x) - cam_x, int(p.y) - cam_y)) for p in projs], doreturn=False)
@@ -0,0 +1,33 @@
+import pygame
+
+class Renderer:
+    """Display list that collects sprite blits and issues them in one call per layer.
+
+    Entities add ``(image, (x, y))`` pairs during the frame and flush() hands
+    each layer to Surface.blits, so the per-sprite loop runs in C instead of
+    making one screen.blit call per entity.
+    """
+    def __init__(self):
+        self.layers = {}  # layer -> [(surface, (x, y)), ...]
+
+    def add(self, image, dst, layer=0):
+        queue = self.layers.get(layer)
+        if queue is None:
+            queue = self.layers[layer] = []
+        queue.append((image, dst))
+
+    def extend(self, blits, layer=0):
+        """Queue a list of (image, (x, y)) pairs at once"""
+        queue = self.layers.get(layer)
+        if queue is None:
+            queue = self.layers[layer] = []
+        queue.extend(blits)
+
+    def flush(self, screen):
+        """Blit every queued sprite, lowest layer first, and empty the list"""
+        layers = self.layers
+        for layer in sorted(layers):
+            queue = layers[layer]
+            if queue:
+                screen.blits(queue, doreturn=False)
+                queue.clear()
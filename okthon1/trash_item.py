@@ -3,7 +3,16 @@ import os
 import random
 import math
 
+def update_item_animations(ticks):
+    """Work out this frame's bob, glow and pulse once, shared by every item"""
+    TrashItem._bob = math.sin(ticks * 0.003) * 3
+    Dustbin._glow = math.sin(ticks * 0.005) * 0.3 + 0.7
+    HealthItem._pulse = 1.0 + math.sin(ticks * 0.005) * 0.1
+
 class TrashItem:
+    # Bob offset shared by every trash item this frame, set by update_item_animations
+    _bob = 0.0
+
     def __init__(self, x, y, image_path, item_type="trash"):
         self.x = x
         self.y = y
@@ -11,7 +20,6 @@ class TrashItem:
         self.height = 32
         self.item_type = item_type
         self.collected = False
-        self.bob_offset = 0
         self.bob_speed = 2.0
         
         # Load and scale image
@@ -23,21 +31,38 @@ class TrashItem:
             self.image = pygame.Surface((self.width, self.height))
             self.image.fill((139, 69, 19))  # Brown color for trash
         
-        self.rect = pygame.Rect(x, y, self.width, self.height)
-    
-    def update(self, dt):
-        """Update trash item with bobbing animation"""
-        self.rect.x = self.x
-        self.rect.y = self.y
-        
-        # Add bobbing animation
-        self.bob_offset = math.sin(pygame.time.get_ticks() * 0.003) * 3
+        # Assign the position rather than passing it to Rect() so it rounds the same
+        # way as when a moved item's rect is re-synced, instead of truncating
+        self.rect = pygame.Rect(0, 0, self.width, self.height)
+        self.rect.x = x
+        self.rect.y = y
+
+    @property
+    def bob_offset(self):
+        """Current bobbing offset, the same for every trash item"""
+        return TrashItem._bob
     
     def draw(self, screen, camera_x, camera_y):
         """Draw trash item with bobbing animation"""
         if not self.collected:
             draw_y = self.y - camera_y + self.bob_offset
             screen.blit(self.image, (self.x - camera_x, draw_y))
+
+    @classmethod
+    def blit_list(cls, items, camera_x, camera_y, view_w, view_h):
+        """Get (image, position) pairs for the uncollected items inside the view, ready for Surface.blits"""
+        bob = cls._bob
+        pairs = []
+        append = pairs.append
+        for item in items:
+            if item.collected:
+                continue
+            dx = int(item.x - camera_x)
+            dy = int(item.y - camera_y + bob)
+            if dx + item.width < 0 or dx > view_w or dy + item.height < 0 or dy > view_h:
+                continue
+            append((item.image, (dx, dy)))
+        return pairs
     
     def check_collision(self, player_rect):
         """Check if player collides with trash item"""
@@ -50,6 +75,14 @@ class TrashItem:
         self.collected = True
 
 class Dustbin:
+    # Glow strength shared by every full dustbin this frame, set by update_item_animations
+    _glow = 0.7
+    # Rasterized glow ellipses, keyed by (width, height, alpha)
+    _glow_surfaces = {}
+    # Count label font, created on first use, and rendered labels keyed by (trash_count, max_capacity)
+    _font = None
+    _count_text = {}
+
     def __init__(self, x, y, image_path):
         self.x = x
         self.y = y
@@ -77,26 +110,63 @@ class Dustbin:
         
         # Add glow effect when full
         if self.is_full():
-            self.full_glow = math.sin(pygame.time.get_ticks() * 0.005) * 0.3 + 0.7
+            self.full_glow = Dustbin._glow
     
     def draw(self, screen, camera_x, camera_y):
         """Draw dustbin with glow effect"""
         # Draw glow effect if full
         if self.is_full() and self.full_glow > 0:
-            glow_surface = pygame.Surface((self.width + 10, self.height + 10), pygame.SRCALPHA)
-            glow_color = (255, 255, 0, int(50 * self.full_glow))
-            pygame.draw.ellipse(glow_surface, glow_color, (0, 0, self.width + 10, self.height + 10))
-            screen.blit(glow_surface, (self.x - camera_x - 5, self.y - camera_y - 5))
+            screen.blit(self.glow_surface(), (self.x - camera_x - 5, self.y - camera_y - 5))
         
         screen.blit(self.image, (self.x - camera_x, self.y - camera_y))
         
         # Draw trash count indicator
-        font = pygame.font.Font(None, 24)
-        color = (255, 255, 255) if not self.is_full() else (255, 255, 0)
-        text = font.render(f"{self.trash_count}/{self.max_capacity}", True, color)
+        text = self.count_text()
         text_rect = text.get_rect(center=(self.x - camera_x + self.width//2, self.y - camera_y - 10))
         screen.blit(text, text_rect)
     
+    def queue_draw(self, renderer, camera_x, camera_y):
+        """Queue the dustbin, its glow and its count text on a Renderer"""
+        # Draw glow effect if full
+        if self.is_full() and self.full_glow > 0:
+            renderer.add(self.glow_surface(), (self.x - camera_x - 5, self.y - camera_y - 5))
+        
+        renderer.add(self.image, (self.x - camera_x, self.y - camera_y))
+        
+        # Draw trash count indicator
+        text = self.count_text()
+        text_rect = text.get_rect(center=(self.x - camera_x + self.width//2, self.y - camera_y - 10))
+        renderer.add(text, text_rect.topleft)
+    
+    def in_view(self, camera_x, camera_y, view_w, view_h):
+        """Check whether the dustbin, its glow or its count label can reach the view"""
+        # The glow spills 5 pixels around the bin and the label sits above it
+        dx = self.x - camera_x
+        dy = self.y - camera_y
+        return not (dx + self.width + 20 < 0 or dx - 20 > view_w or dy + self.height + 20 < 0 or dy - 20 > view_h)
+
+    def count_text(self):
+        """Get the rendered count label, which only changes when trash is added"""
+        key = (self.trash_count, self.max_capacity)
+        text = Dustbin._count_text.get(key)
+        if text is None:
+            if Dustbin._font is None:
+                Dustbin._font = pygame.font.Font(None, 24)
+            color = (255, 255, 255) if not self.is_full() else (255, 255, 0)
+            text = Dustbin._font.render(f"{self.trash_count}/{self.max_capacity}", True, color)
+            Dustbin._count_text[key] = text
+        return text
+
+    def glow_surface(self):
+        """Get the glow ellipse for the current glow strength, rasterizing each alpha level once"""
+        key = (self.width, self.height, int(50 * self.full_glow))
+        glow_surface = Dustbin._glow_surfaces.get(key)
+        if glow_surface is None:
+            glow_surface = pygame.Surface((self.width + 10, self.height + 10), pygame.SRCALPHA)
+            pygame.draw.ellipse(glow_surface, (255, 255, 0, key[2]), (0, 0, self.width + 10, self.height + 10))
+            Dustbin._glow_surfaces[key] = glow_surface
+        return glow_surface
+
     def check_collision(self, player_rect):
         """Check if player collides with dustbin"""
         return self.rect.colliderect(player_rect)
@@ -113,6 +183,11 @@ class Dustbin:
         return self.trash_count >= self.max_capacity
 
 class HealthItem:
+    # Pulse scale shared by every health item this frame, set by update_item_animations
+    _pulse = 1.0
+    # Pulse-scaled images shared by every health item, keyed by (image_path, width, height)
+    _pulse_frames = {}
+
     def __init__(self, x, y, image_path):
         self.x = x
         self.y = y
@@ -121,6 +196,7 @@ class HealthItem:
         self.collected = False
         self.bob_offset = 0
         self.pulse_scale = 1.0
+        self.image_path = image_path
         
         # Load and scale image
         if os.path.exists(image_path):
@@ -139,7 +215,7 @@ class HealthItem:
         self.rect.y = self.y
         
         # Add pulsing animation
-        self.pulse_scale = 1.0 + math.sin(pygame.time.get_ticks() * 0.005) * 0.1
+        self.pulse_scale = HealthItem._pulse
     
     def draw(self, screen, camera_x, camera_y):
         """Draw health item with pulsing animation"""
@@ -147,7 +223,12 @@ class HealthItem:
             # Scale the image for pulsing effect
             scaled_width = int(self.width * self.pulse_scale)
             scaled_height = int(self.height * self.pulse_scale)
-            scaled_image = pygame.transform.scale(self.image, (scaled_width, scaled_height))
+            # The pulse only ever produces a handful of whole-pixel sizes, so scale each once
+            key = (self.image_path, scaled_width, scaled_height)
+            scaled_image = HealthItem._pulse_frames.get(key)
+            if scaled_image is None:
+                scaled_image = pygame.transform.scale(self.image, (scaled_width, scaled_height))
+                HealthItem._pulse_frames[key] = scaled_image
             
             # Center the scaled image
             draw_x = self.x - camera_x - (scaled_width - self.width) // 2